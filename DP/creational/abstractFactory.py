@@ -20,119 +20,151 @@ By the end of this module, you'll have a practical understanding of how to apply
 allowing you to create families of objects with a cohesive and unified set of products.
 """
 
+import gc
+import importlib
+import threading
+import time
 from abc import ABC, abstractmethod
 
 # Abstract Product: Chair
+# Products are slotted: no per-instance __dict__, which matters when building millions of them.
 class Chair(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def sit_on(self):
         pass
 
 # Concrete Products: ModernChair and VictorianChair
 class ModernChair(Chair):
+    __slots__ = ()
+
     def sit_on(self):
         return "Sitting on a modern chair."
 
 class VictorianChair(Chair):
+    __slots__ = ()
+
     def sit_on(self):
         return "Sitting on a Victorian chair."
 
 # Abstract Product: Table
 class Table(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def put_item(self):
         pass
 
 # Concrete Products: ModernTable and VictorianTable
 class ModernTable(Table):
+    __slots__ = ()
+
     def put_item(self):
         return "Putting an item on a modern table."
 
 class VictorianTable(Table):
+    __slots__ = ()
+
     def put_item(self):
         return "Putting an item on a Victorian table."
 
-# Abstract Factory: FurnitureFactory
-class FurnitureFactory(ABC):
-    @abstractmethod
-    def create_chair(self) -> Chair:
-        pass
+# Abstract Product: Sofa (stateful, every sofa gets its own cushions)
+class Sofa(ABC):
+    __slots__ = ("cushions",)
 
-    @abstractmethod
-    def create_table(self) -> Table:
-        pass
+    def __init__(self):
+        self.cushions = ()  # a tuple, so a new sofa is a single allocation
 
-# Concrete Factories: ModernFurnitureFactory and VictorianFurnitureFactory
-class ModernFurnitureFactory(FurnitureFactory):
-    def create_chair(self) -> Chair:
-        return ModernChair()
+    def add_cushion(self, color):
+        self.cushions += (color,)
 
-    def create_table(self) -> Table:
-        return ModernTable()
+    def reset(self):
+        self.cushions = ()
 
-class VictorianFurnitureFactory(FurnitureFactory):
-    def create_chair(self) -> Chair:
-        return VictorianChair()
-
-    def create_table(self) -> Table:
-        return VictorianTable()
-
-# Client
-def build_furniture(factory: FurnitureFactory):
-    chair = factory.create_chair()
-    table = factory.create_table()
-    return chair, table
-
-# Usage
-modern_factory = ModernFurnitureFactory()
-victorian_factory = VictorianFurnitureFactory()
-
-modern_chair, modern_table = build_furniture(modern_factory)
-victorian_chair, victorian_table = build_furniture(victorian_factory)
-
-print(modern_chair.sit_on())
-print(modern_table.put_item())
-
-print(victorian_chair.sit_on())
-print(victorian_table.put_item())
-
-# In this code, the creation of chairs and tables is done by separate factories, 
-# leading to inconsistencies and lack of cohesion in the product families.
-
-from abc import ABC, abstractmethod
-
-# Abstract Product: Chair
-class Chair(ABC):
-    @abstractmethod
-    def sit_on(self):
-        pass
-
-# Concrete Products: ModernChair and VictorianChair
-class ModernChair(Chair):
-    def sit_on(self):
-        return "Sitting on a modern chair."
-
-class VictorianChair(Chair):
-    def sit_on(self):
-        return "Sitting on a Victorian chair."
-
-# Abstract Product: Table
-class Table(ABC):
     @abstractmethod
-    def put_item(self):
+    def lie_on(self):
         pass
 
-# Concrete Products: ModernTable and VictorianTable
-class ModernTable(Table):
-    def put_item(self):
-        return "Putting an item on a modern table."
-
-class VictorianTable(Table):
-    def put_item(self):
-        return "Putting an item on a Victorian table."
+# Concrete Products: ModernSofa and VictorianSofa
+class ModernSofa(Sofa):
+    __slots__ = ()
+
+    def lie_on(self):
+        return f"Lying on a modern sofa with {len(self.cushions)} cushions."
+
+class VictorianSofa(Sofa):
+    __slots__ = ()
+
+    def lie_on(self):
+        return f"Lying on a Victorian sofa with {len(self.cushions)} cushions."
+
+# Object Pool for stateful products:
+# released products are reset and handed out again instead of allocating new ones,
+# at most max_size idle products are kept, the rest are left to the garbage collector.
+class ObjectPool:
+    def __init__(self, product_class, max_size=64):
+        self.product_class = product_class
+        self.max_size = max_size
+        self._idle = []
+        self._idle_ids = set()  # a product can only be idle once
+        self.created = 0
+        self.reused = 0
+        self.dropped = 0
+
+    def acquire(self):
+        if self._idle:
+            self.reused += 1
+            product = self._idle.pop()
+            self._idle_ids.discard(id(product))
+            return product
+        self.created += 1
+        return self.product_class()
+
+    def release(self, product):
+        if not isinstance(product, self.product_class):
+            raise TypeError(f"{type(product).__name__} does not belong to this pool")
+        if id(product) in self._idle_ids:
+            raise ValueError(f"{type(product).__name__} was already released")
+        if len(self._idle) < self.max_size:
+            product.reset()
+            self._idle.append(product)
+            self._idle_ids.add(id(product))
+        else:
+            self.dropped += 1
 
 # Abstract Factory: FurnitureFactory
+# Stateless products (chairs, tables) are shared: one instance per product class.
+# Stateful products (sofas) come from a bounded ObjectPool and go back with release().
 class FurnitureFactory(ABC):
+    _shared_instances = {}
+
+    def __init__(self, pool_size=64):
+        self.pool_size = pool_size
+        self._pools = {}
+
+    def shared(self, product_class):
+        instance = FurnitureFactory._shared_instances.get(product_class)
+        if instance is None:
+            instance = FurnitureFactory._shared_instances[product_class] = product_class()
+        return instance
+
+    def pooled(self, product_class):
+        pool = self._pools.get(product_class)
+        if pool is None:
+            pool = self._pools[product_class] = ObjectPool(product_class, self.pool_size)
+        return pool.acquire()
+
+    def release(self, product):
+        pool = self._pools.get(type(product))
+        if pool is None:
+            raise TypeError(f"{type(product).__name__} does not belong to this factory's pools")
+        pool.release(product)
+
+    def pool_stats(self):
+        return {product_class.__name__: {"created": pool.created, "reused": pool.reused, "dropped": pool.dropped}
+                for product_class, pool in self._pools.items()}
+
     @abstractmethod
     def create_chair(self) -> Chair:
         pass
@@ -141,20 +173,69 @@ class FurnitureFactory(ABC):
     def create_table(self) -> Table:
         pass
 
+    def create_sofa(self) -> Sofa:
+        # pooled sofas of sofa_class, override for anything else
+        if self.sofa_class is None:
+            raise NotImplementedError(f"{type(self).__name__} sets no sofa_class and does not override create_sofa")
+        return self.pooled(self.sofa_class)
+
+    # Sofa class of the family, create_family_batch allocates it directly unless create_sofa is overridden
+    sofa_class = None
+
+    def create_family_batch(self, n, pause_gc=False):
+        # n matched (chair, table, sofa) families in one call. Chairs and tables are repeated
+        # with list multiplication only when the factory shares them (two calls return the same
+        # instance), otherwise every family gets its own. Sofas are new, unpooled objects.
+        # pause_gc=True pauses the cyclic GC while the batch is allocated: the new objects cannot
+        # form reference cycles, but gc.disable() is process-wide, so only opt in when no other
+        # thread depends on collections running in the meantime.
+        if n <= 0:
+            return []
+        gc_was_enabled = pause_gc and gc.isenabled()
+        if gc_was_enabled:
+            gc.disable()
+        try:
+            chairs = self._repeat(self.create_chair, n)
+            tables = self._repeat(self.create_table, n)
+            sofa_class = self.sofa_class
+            if sofa_class is not None and type(self).create_sofa is FurnitureFactory.create_sofa:
+                sofas = [sofa_class() for _ in range(n)]
+            else:
+                create_sofa = self.create_sofa
+                sofas = [create_sofa() for _ in range(n)]
+            return list(zip(chairs, tables, sofas))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @staticmethod
+    def _repeat(create, n):
+        product = create()
+        if n == 1:
+            return [product]
+        second = create()
+        if second is product:  # a shared, stateless product
+            return [product] * n
+        return [product, second] + [create() for _ in range(n - 2)]
+
 # Concrete Factories: ModernFurnitureFactory and VictorianFurnitureFactory
 class ModernFurnitureFactory(FurnitureFactory):
+    sofa_class = ModernSofa
+
     def create_chair(self) -> Chair:
-        return ModernChair()
+        return self.shared(ModernChair)
 
     def create_table(self) -> Table:
-        return ModernTable()
+        return self.shared(ModernTable)
 
 class VictorianFurnitureFactory(FurnitureFactory):
+    sofa_class = VictorianSofa
+
     def create_chair(self) -> Chair:
-        return VictorianChair()
+        return self.shared(VictorianChair)
 
     def create_table(self) -> Table:
-        return VictorianTable()
+        return self.shared(VictorianTable)
 
 # Client
 def build_furniture(factory: FurnitureFactory):
@@ -162,15 +243,148 @@ def build_furniture(factory: FurnitureFactory):
     table = factory.create_table()
     return chair, table
 
-# Usage
-modern_factory = ModernFurnitureFactory()
-victorian_factory = VictorianFurnitureFactory()
-
-modern_chair, modern_table = build_furniture(modern_factory)
-victorian_chair, victorian_table = build_furniture(victorian_factory)
-
-print(modern_chair.sit_on())
-print(modern_table.put_item())
-
-print(victorian_chair.sit_on())
-print(victorian_table.put_item())
\ No newline at end of file
+# Factory Registry
+# Families register by name, either with their factory class or lazily with a
+# "module:ClassName" path. A lazy family's module is imported on its first lookup,
+# so a service only pays the import and set-up cost of the families it uses.
+# Paths starting with "." are resolved relative to the registry's package.
+class FurnitureFactoryRegistry:
+    def __init__(self, package=None):
+        self.package = package
+        self._factory_classes = {}
+        self._lazy_paths = {}
+        self._factories = {}
+        self._lock = threading.Lock()  # first lookups of a lazy family may race
+
+    def register(self, name, factory_class):
+        self._factory_classes[name] = factory_class
+        self._lazy_paths.pop(name, None)
+        self._factories.pop(name, None)
+
+    def register_lazy(self, name, path):
+        if ":" not in path:
+            raise ValueError(f"Expected 'module:ClassName', got {path!r}")
+        self._lazy_paths[name] = path
+        self._factory_classes.pop(name, None)
+        self._factories.pop(name, None)
+
+    def names(self):
+        return sorted(self._factory_classes.keys() | self._lazy_paths.keys())
+
+    def is_loaded(self, name):
+        return name in self._factory_classes
+
+    def get(self, name) -> FurnitureFactory:
+        factory = self._factories.get(name)
+        if factory is not None:
+            return factory
+        with self._lock:
+            factory = self._factories.get(name)
+            if factory is None:
+                factory_class = self._factory_classes.get(name)
+                if factory_class is None:
+                    path = self._lazy_paths.get(name)
+                    if path is None:
+                        raise KeyError(f"Unknown furniture family {name!r}, registered: {', '.join(self.names())}")
+                    factory_class = self._import(path)
+                    self._factory_classes[name] = factory_class
+                    self._lazy_paths.pop(name, None)
+                factory = self._factories[name] = factory_class()
+        return factory
+
+    def _import(self, path):
+        module_name, class_name = path.split(":")
+        if module_name.startswith(".") and not self.package:
+            module_name = module_name.lstrip(".")  # run as a script, the family sits next to it
+        return getattr(importlib.import_module(module_name, self.package or None), class_name)
+
+furniture_families = FurnitureFactoryRegistry(__package__)
+furniture_families.register("modern", ModernFurnitureFactory)
+furniture_families.register("victorian", VictorianFurnitureFactory)
+furniture_families.register_lazy("art_deco", ".artDecoFurniture:ArtDecoFurnitureFactory")
+
+# Allocation benchmark: new products per set vs. shared and pooled products
+def benchmark_furniture_sets(n_sets=1_000_000):
+    def measure(name, build):
+        collections_before = sum(stats["collections"] for stats in gc.get_stats())
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        collections = sum(stats["collections"] for stats in gc.get_stats()) - collections_before
+        print(f"{name:>24}: {n_sets / elapsed:,.0f} sets/s, {collections} GC collections")
+
+    # stateless products kept in an inventory: every new instance is one more object the GC tracks
+    factory = ModernFurnitureFactory()
+    measure("New chairs and tables", lambda: [(ModernChair(), ModernTable()) for _ in range(n_sets)])
+    measure("Shared chairs and tables", lambda: [(factory.create_chair(), factory.create_table())
+                                                 for _ in range(n_sets)])
+
+    # stateful products that are used and given back
+    def new_sofas():
+        for _ in range(n_sets):
+            ModernSofa().add_cushion("grey")
+
+    def pooled_sofas():
+        for _ in range(n_sets):
+            sofa = factory.create_sofa()
+            sofa.add_cushion("grey")
+            factory.release(sofa)
+    measure("New sofas", new_sofas)
+    measure("Pooled sofas", pooled_sofas)
+
+    # whole families for a catalog simulation
+    def loop_build_furniture():
+        families = []
+        for _ in range(n_sets):
+            chair, table = build_furniture(factory)
+            families.append((chair, table, factory.create_sofa()))
+        return families
+    measure("Looping build_furniture", loop_build_furniture)
+    measure("create_family_batch", lambda: factory.create_family_batch(n_sets))
+    measure("... with pause_gc=True", lambda: factory.create_family_batch(n_sets, pause_gc=True))
+
+
+# Import-time benchmark: the first lookup of a lazy family imports its module, later lookups are a dict hit
+def benchmark_registry_lookup(registry=furniture_families, name="art_deco"):
+    start = time.perf_counter()
+    registry.get(name)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    registry.get(name)
+    cached = time.perf_counter() - start
+    print(f"First lookup of {name!r} (imports its module): {first * 1000:.3f} ms")
+    print(f"Cached lookup: {cached * 1000:.4f} ms")
+
+# Client Code
+if __name__ == "__main__":
+    modern_factory = ModernFurnitureFactory()
+    victorian_factory = VictorianFurnitureFactory()
+
+    modern_chair, modern_table = build_furniture(modern_factory)
+    victorian_chair, victorian_table = build_furniture(victorian_factory)
+
+    print(modern_chair.sit_on())
+    print(modern_table.put_item())
+
+    print(victorian_chair.sit_on())
+    print(victorian_table.put_item())
+
+    sofa = modern_factory.create_sofa()
+    sofa.add_cushion("green")
+    print(sofa.lie_on())
+    modern_factory.release(sofa)
+    print(modern_factory.create_sofa().lie_on())  # the same sofa, reset
+    print(modern_factory.pool_stats())
+
+    for chair, table, sofa in victorian_factory.create_family_batch(2):
+        print(chair.sit_on(), table.put_item(), sofa.lie_on())
+
+    print(f"Registered families: {furniture_families.names()}")
+    print(f"art_deco loaded: {furniture_families.is_loaded('art_deco')}")
+    benchmark_registry_lookup()
+    art_deco_factory = furniture_families.get("art_deco")
+    print(art_deco_factory.create_chair().sit_on())
+    print(f"art_deco is a FurnitureFactory: {isinstance(art_deco_factory, FurnitureFactory)}")
+    print(f"art_deco loaded: {furniture_families.is_loaded('art_deco')}")
+
+    benchmark_furniture_sets()
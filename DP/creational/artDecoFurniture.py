@@ -0,0 +1,52 @@
+"""
+Art Deco Furniture Family
+
+Description:
+A furniture family that lives in its own module and is registered lazily in the
+abstract factory registry (see abstractFactory.py). Nothing in this module is
+imported until a client asks the registry for the "art_deco" family.
+"""
+
+import importlib
+import sys
+
+def _base_module():
+    # the abstractFactory module that is already running, never a second copy of it
+    main = sys.modules.get("__main__")
+    if getattr(main, "FurnitureFactoryRegistry", None) is not None:
+        return main  # abstractFactory.py runs as a script (or with python -m)
+    if __package__:
+        return importlib.import_module(".abstractFactory", __package__)
+    return importlib.import_module("abstractFactory")
+
+_base = _base_module()
+Chair, FurnitureFactory, Sofa, Table = _base.Chair, _base.FurnitureFactory, _base.Sofa, _base.Table
+
+# Concrete Products: ArtDecoChair, ArtDecoTable and ArtDecoSofa
+class ArtDecoChair(Chair):
+    __slots__ = ()
+
+    def sit_on(self):
+        return "Sitting on an Art Deco chair."
+
+class ArtDecoTable(Table):
+    __slots__ = ()
+
+    def put_item(self):
+        return "Putting an item on an Art Deco table."
+
+class ArtDecoSofa(Sofa):
+    __slots__ = ()
+
+    def lie_on(self):
+        return f"Lying on an Art Deco sofa with {len(self.cushions)} cushions."
+
+# Concrete Factory: ArtDecoFurnitureFactory
+class ArtDecoFurnitureFactory(FurnitureFactory):
+    sofa_class = ArtDecoSofa
+
+    def create_chair(self) -> Chair:
+        return self.shared(ArtDecoChair)
+
+    def create_table(self) -> Table:
+        return self.shared(ArtDecoTable)
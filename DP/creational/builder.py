@@ -21,6 +21,9 @@ improving the readability and maintainability of complex object creation.
 
 """
 
+import csv
+import itertools
+
 # Problematic Code
 
 class Computer:
@@ -45,36 +48,254 @@ computer_2.display_specs()
 # In this code, creating a Computer instance with various optional configurations leads to long and complex constructor calls. 
 # It's challenging to keep track of which parameter corresponds to each configuration option.
 
+LegacyComputer = Computer  # the mutable version above, kept for the benchmark below
+
+# The Computer the builder emits is an immutable, slotted record:
+# no per-instance __dict__, and no way to change a configuration after it was built.
+class Computer:
+    FIELDS = ("cpu", "memory", "storage", "gpu", "sound", "wifi")
+    REQUIRED = ("cpu", "memory", "storage")
+    __slots__ = FIELDS
+
+    def __init__(self, cpu, memory, storage, gpu=None, sound=None, wifi=None):
+        # the slot descriptors write the fields directly, bypassing the blocked __setattr__
+        _set_cpu(self, cpu)
+        _set_memory(self, memory)
+        _set_storage(self, storage)
+        _set_gpu(self, gpu)
+        _set_sound(self, sound)
+        _set_wifi(self, wifi)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Computer is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Computer is immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        # copy, deepcopy and pickle rebuild through __init__ instead of setting slots
+        return (Computer, self.as_tuple())
+
+    def as_tuple(self):
+        return (self.cpu, self.memory, self.storage, self.gpu, self.sound, self.wifi)
+
+    def __eq__(self, other):
+        return isinstance(other, Computer) and self.as_tuple() == other.as_tuple()
+
+    def __hash__(self):
+        return hash(self.as_tuple())
+
+    def __repr__(self):
+        return "Computer(" + ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS) + ")"
+
+    def display_specs(self):
+        print(f"CPU: {self.cpu}, Memory: {self.memory}, Storage: {self.storage}, GPU: {self.gpu}, Sound: {self.sound}, WiFi: {self.wifi}")
+
+_set_cpu, _set_memory, _set_storage, _set_gpu, _set_sound, _set_wifi = (
+    Computer.__dict__[name].__set__ for name in Computer.FIELDS
+)
+
+def _require_fields(values):
+    # values in Computer.FIELDS order, the REQUIRED fields come first
+    if values[0] is None or values[1] is None or values[2] is None:
+        missing = [name for name, value in zip(Computer.REQUIRED, values) if value is None]
+        raise ValueError(f"Cannot build a Computer without {', '.join(missing)}")
+
+# Frozen, copy-on-write configuration specs
+# A derived spec stores only the fields it overrides plus a reference to its base,
+# so a fleet of variants shares every unchanged field with the base spec.
+# Overrides are kept as a flat (name, value, name, value, ...) tuple, the smallest container for a few fields.
+# Chains are flattened after MAX_DEPTH derivations to keep lookups short.
+class ComputerSpec:
+    __slots__ = ("_base", "_overrides", "_depth", "_computer")
+    MAX_DEPTH = 8
+
+    def __init__(self, base=None, **overrides):
+        unknown = set(overrides) - set(Computer.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown computer fields: {sorted(unknown)}")
+        if base is not None and base._depth >= self.MAX_DEPTH:
+            overrides = dict(base.as_dict(), **overrides)
+            base = None
+        self._base = base
+        self._overrides = tuple(item for pair in overrides.items() for item in pair)
+        self._depth = 0 if base is None else base._depth + 1
+        self._computer = None
+
+    def get(self, name):
+        spec = self
+        while spec is not None:
+            overrides = spec._overrides
+            for index in range(0, len(overrides), 2):
+                if overrides[index] == name:
+                    return overrides[index + 1]
+            spec = spec._base
+        return None
+
+    def derive(self, **overrides):
+        return ComputerSpec(self, **overrides)
+
+    def values(self):
+        return tuple(self.get(name) for name in Computer.FIELDS)
+
+    def as_dict(self):
+        return dict(zip(Computer.FIELDS, self.values()))
+
+    def build(self):
+        # Computers are immutable, so every build of the same spec can share one instance
+        if self._computer is None:
+            values = self.values()
+            _require_fields(values)
+            self._computer = Computer(*values)
+        return self._computer
+
+    def overrides(self):
+        return dict(zip(self._overrides[::2], self._overrides[1::2]))
+
+    def __repr__(self):
+        return f"ComputerSpec({self.overrides()!r}, depth={self._depth})"
+
+# Named presets, variants are derived from them instead of built from scratch
+PRESETS = {}
+
+def register_preset(name, spec):
+    PRESETS[name] = spec
+    return spec
+
+register_preset("office", ComputerSpec(cpu="Intel i5", memory="16GB", storage="512GB SSD", wifi="WiFi 6"))
+register_preset("workstation", PRESETS["office"].derive(cpu="Intel i9", memory="64GB", gpu="NVIDIA RTX 4080"))
+register_preset("gaming", PRESETS["workstation"].derive(memory="32GB", sound="Sound Blaster"))
+
+# The builder accumulates the fields in one small list (its spec) that is allocated once,
+# build() only allocates the Computer, and reset() clears the spec in place,
+# so a single builder can be reused in a hot loop.
 class ComputerBuilder:
-    def __init__(self):
-        self.computer = Computer()
+    _EMPTY_SPEC = (None,) * len(Computer.FIELDS)
+
+    def __init__(self, base: ComputerSpec = None):
+        # with a base spec, reset() returns to the base values instead of an empty spec
+        self._base = base
+        self._reset_values = self._EMPTY_SPEC if base is None else base.values()
+        self._spec = list(self._reset_values)
+
+    @classmethod
+    def from_preset(cls, name):
+        return cls(PRESETS[name])
+
+    def reset(self):
+        self._spec[:] = self._reset_values
+        return self
+
+    def to_spec(self):
+        # a frozen spec holding only the fields changed relative to the base
+        changed = {name: value for name, value, base_value in zip(Computer.FIELDS, self._spec, self._reset_values)
+                   if value is not base_value and value != base_value}
+        return ComputerSpec(self._base, **changed)
 
     def set_cpu(self, cpu):
-        self.computer.cpu = cpu
+        self._spec[0] = cpu
         return self
 
     def set_memory(self, memory):
-        self.computer.memory = memory
+        self._spec[1] = memory
         return self
 
     def set_storage(self, storage):
-        self.computer.storage = storage
+        self._spec[2] = storage
         return self
 
     def set_gpu(self, gpu):
-        self.computer.gpu = gpu
+        self._spec[3] = gpu
         return self
 
     def set_sound(self, sound):
-        self.computer.sound = sound
+        self._spec[4] = sound
         return self
 
     def set_wifi(self, wifi):
-        self.computer.wifi = wifi
+        self._spec[5] = wifi
         return self
 
-    def build(self):
-        return self.computer
+    def build(self, reset=False):
+        spec = self._spec
+        _require_fields(spec)
+        computer = Computer(*spec)
+        if reset:
+            spec[:] = self._reset_values
+        return computer
+
+# Bulk, column-oriented builder for spec sheets (CSV files with one column per component)
+# Rows are read batch_size at a time and transposed into columns, then every column is
+# validated as a whole. The low-cardinality component columns (INTERNED_FIELDS) are also
+# interned, so the same CPU or GPU on thousands of rows ends up as one shared string; each
+# intern table stops growing once it holds max_interned names (checked per batch).
+# Memory is bounded by the batch size and the intern tables.
+class ComputerSpecError(ValueError):
+    pass
+
+class BulkComputerBuilder:
+    INTERNED_FIELDS = ("cpu", "gpu")
+
+    def __init__(self, csv_file, batch_size=10_000, delimiter=",", max_interned=4096):
+        self._reader = csv.reader(csv_file, delimiter=delimiter)
+        self.batch_size = batch_size
+        self.max_interned = max_interned
+        self._interned = {name: {} for name in self.INTERNED_FIELDS}
+        header = next(self._reader, None)
+        if header is None:
+            raise ComputerSpecError("The spec sheet is empty")
+        header = [name.strip().lower() for name in header]
+        unknown = set(header) - set(Computer.FIELDS)
+        missing = set(Computer.REQUIRED) - set(header)
+        if unknown or missing:
+            raise ComputerSpecError(f"Unknown columns: {sorted(unknown)}, missing columns: {sorted(missing)}")
+        self._positions = [header.index(name) if name in header else None for name in Computer.FIELDS]
+        self._width = len(header)
+        self._first_row = 2  # line number of the first data row, for error messages
+
+    def iter_batches(self):
+        # yields {field: list of values} per batch, optional empty cells are None
+        while True:
+            rows = list(itertools.islice(self._reader, self.batch_size))
+            if not rows:
+                return
+            yield self._columns(rows)
+            self._first_row += len(rows)
+
+    def iter_computer_batches(self):
+        # yields one list of Computers per batch
+        for batch in self.iter_batches():
+            yield list(map(Computer, *(batch[name] for name in Computer.FIELDS)))
+
+    def iter_computers(self):
+        for computers in self.iter_computer_batches():
+            yield from computers
+
+    def _columns(self, rows):
+        widths = set(map(len, rows))
+        if widths != {self._width}:
+            line = next(index for index, row in enumerate(rows) if len(row) != self._width)
+            raise ComputerSpecError(f"Line {self._first_row + line} has {len(rows[line])} cells, "
+                                    f"expected {self._width}")
+        transposed = list(zip(*rows))
+        columns = {}
+        for name, position in zip(Computer.FIELDS, self._positions):
+            if position is None:
+                columns[name] = [None] * len(rows)
+                continue
+            column = list(map(str.strip, transposed[position]))  # cells are trimmed like the header
+            if "" in column:
+                if name in Computer.REQUIRED:
+                    raise ComputerSpecError(f"Line {self._first_row + column.index('')} has no {name}")
+                column = [value or None for value in column]
+            table = self._interned.get(name)
+            if table is None:
+                columns[name] = column
+                continue
+            # a full table still hands out the names it has, it just takes no new ones
+            intern = table.setdefault if len(table) < self.max_interned else table.get
+            columns[name] = list(map(intern, column, column))
+        return columns
 
 # Usage
 builder = ComputerBuilder()
@@ -91,3 +312,122 @@ computer_2 = builder.set_cpu("AMD Ryzen")\
                     .set_gpu("NVIDIA RTX 3080")\
                     .build()
 computer_2.display_specs()
+
+# the same builder, reset and reused
+computer_3 = builder.reset()\
+                    .set_cpu("Apple M2")\
+                    .set_memory("16GB")\
+                    .set_storage("1TB SSD")\
+                    .set_wifi("WiFi 6E")\
+                    .build(reset=True)
+computer_3.display_specs()
+
+# presets: only the changed fields are stored, the rest is shared with the base
+gaming_rig = ComputerBuilder.from_preset("gaming").set_gpu("AMD RX 7900").build()
+gaming_rig.display_specs()
+silent_office = PRESETS["office"].derive(storage="1TB SSD")
+silent_office.build().display_specs()
+print(silent_office)
+
+# bulk building from a spec sheet
+from io import StringIO
+spec_sheet = StringIO("cpu,memory,storage,gpu\nIntel i7,16GB,512GB SSD,\nAMD Ryzen,32GB,1TB HDD,NVIDIA RTX 3080\n")
+for computer in BulkComputerBuilder(spec_sheet).iter_computers():
+    computer.display_specs()
+
+def benchmark_builder(n_computers=1_000_000):
+    import time
+    import tracemalloc
+
+    cpus = ["Intel i7", "AMD Ryzen", "Apple M2"]
+    memories = ["16GB", "32GB", "64GB"]
+
+    start = time.perf_counter()
+    legacy = [LegacyComputer(cpus[i % 3], memories[i % 3], "512GB SSD") for i in range(n_computers)]
+    print(f"Mutable Computer: {n_computers / (time.perf_counter() - start):,.0f} computers/s")
+    del legacy
+
+    start = time.perf_counter()
+    built = [ComputerBuilder().set_cpu(cpus[i % 3]).set_memory(memories[i % 3]).set_storage("512GB SSD").build()
+             for i in range(n_computers)]
+    print(f"New builder each: {n_computers / (time.perf_counter() - start):,.0f} computers/s")
+    del built
+
+    builder = ComputerBuilder()
+    start = time.perf_counter()
+    built = [builder.set_cpu(cpus[i % 3]).set_memory(memories[i % 3]).set_storage("512GB SSD").build(reset=True)
+             for i in range(n_computers)]
+    print(f"Reused builder:   {n_computers / (time.perf_counter() - start):,.0f} computers/s")
+    del built
+
+    for name, make in (("Mutable Computer", lambda: LegacyComputer("Intel i7", "16GB", "512GB SSD")),
+                       ("Slotted Computer", lambda: Computer("Intel i7", "16GB", "512GB SSD"))):
+        tracemalloc.start()
+        kept = [make() for _ in range(100_000)]
+        size = tracemalloc.get_traced_memory()[0] / len(kept)
+        tracemalloc.stop()
+        del kept
+        print(f"{name}: {size:.0f} bytes per instance")
+
+def benchmark_bulk_builder(n_rows=500_000):
+    import io
+    import time
+
+    cpus = ["Intel i7", "AMD Ryzen", "Apple M2"]
+    gpus = ["NVIDIA RTX 3080", "", "AMD RX 7900"]
+    sheet = io.StringIO()
+    sheet.write("cpu,memory,storage,gpu\n")
+    for i in range(n_rows):
+        sheet.write(f"{cpus[i % 3]},{16 << (i % 3)}GB,512GB SSD,{gpus[i % 3]}\n")
+
+    sheet.seek(0)
+    start = time.perf_counter()
+    builder = ComputerBuilder()
+    reader = csv.DictReader(sheet)
+    per_row = [builder.set_cpu(row["cpu"]).set_memory(row["memory"]).set_storage(row["storage"])
+               .set_gpu(row["gpu"] or None).build(reset=True) for row in reader]
+    print(f"Per-row builder:  {n_rows / (time.perf_counter() - start):,.0f} rows/s")
+
+    sheet.seek(0)
+    start = time.perf_counter()
+    for batch in BulkComputerBuilder(sheet).iter_batches():
+        pass
+    print(f"Columnar batches: {n_rows / (time.perf_counter() - start):,.0f} rows/s")
+
+    sheet.seek(0)
+    start = time.perf_counter()
+    bulk = [computer for computers in BulkComputerBuilder(sheet).iter_computer_batches() for computer in computers]
+    print(f"Bulk Computers:   {n_rows / (time.perf_counter() - start):,.0f} rows/s")
+    assert bulk == per_row
+    print(f"Distinct CPU strings: {len({id(computer.cpu) for computer in bulk})} (per-row: "
+          f"{len({id(computer.cpu) for computer in per_row})})")
+
+def benchmark_presets(n_variants=200_000):
+    import time
+    import tracemalloc
+
+    memories = ["16GB", "32GB", "64GB", "128GB"]
+    base = PRESETS["workstation"]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    full = [ComputerBuilder().set_cpu("Intel i9").set_memory(memories[i % 4]).set_storage("512GB SSD")
+            .set_gpu("NVIDIA RTX 4080").set_wifi("WiFi 6").to_spec() for i in range(n_variants)]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Full specs:    {n_variants / elapsed:,.0f} variants/s, {size / n_variants:.0f} bytes each")
+    del full
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    derived = [base.derive(memory=memories[i % 4]) for i in range(n_variants)]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Derived specs: {n_variants / elapsed:,.0f} variants/s, {size / n_variants:.0f} bytes each")
+
+if __name__ == "__main__":
+    benchmark_builder()
+    benchmark_presets()
+    benchmark_bulk_builder()
@@ -0,0 +1,161 @@
+"""
+Card File Classifier
+
+Description:
+Command-line entry point that classifies a (multi-GB) file of card numbers, one per line,
+through the CardFactory from factory.py.
+
+The input is memory-mapped and split into chunks on line boundaries. Each worker process
+maps the same file and classifies only its own byte range, so only per card type counts
+are sent back to the parent. With --output-dir the routed numbers of each chunk are sent
+back too and written to one file per card type, in their original order; a bounded number
+of chunks is in flight at a time, so the parent holds a few chunks' worth of numbers at most.
+Blank lines are skipped and surrounding whitespace is ignored.
+
+Usage:
+    python cardFileClassifier.py cards.txt
+    python cardFileClassifier.py cards.txt --output-dir routed/ --workers 8
+    python cardFileClassifier.py cards.txt --generate 10000000 --benchmark
+"""
+
+import argparse
+import mmap
+import os
+import random
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from factory import CardFactory
+
+_card_factory = None
+
+def _init_worker():
+    global _card_factory
+    _card_factory = CardFactory()
+
+def chunk_boundaries(path, chunk_size):
+    # (start, end) byte ranges that each end right after a newline (or at the end of the file)
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    boundaries = []
+    with open(path, "rb") as card_file, mmap.mmap(card_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                newline = data.find(b"\n", end - 1)
+                end = size if newline == -1 else newline + 1
+            boundaries.append((start, end))
+            start = end
+    return boundaries
+
+def card_numbers(lines):
+    # the one line handling shared by every path: strip each line, skip blank ones
+    for line in lines:
+        card_number = line.strip()
+        if card_number:
+            yield card_number
+
+def classify_chunk(path, start, end, route):
+    # runs in a worker process: returns per-type counts, and the routed lines when route is set
+    card_factory = _card_factory or CardFactory()
+    classify, names = card_factory.classifier.classify, {}
+    counts = Counter()
+    routed = {}
+    with open(path, "rb") as card_file, mmap.mmap(card_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        lines = data[start:end].decode("ascii").split("\n")
+    for card_number in card_numbers(lines):
+        code = classify(card_number)
+        counts[code] += 1
+        if route:
+            routed.setdefault(code, []).append(card_number)
+    for code in counts:
+        names[code] = card_factory.card_type_name(code)
+    counts = {names[code]: count for code, count in counts.items()}
+    routed = {names[code]: "\n".join(numbers) + "\n" for code, numbers in routed.items()}
+    return counts, routed
+
+def _ordered_results(executor, path, chunks, route, max_in_flight):
+    # like executor.map, but submits the next chunk only once the oldest one is collected
+    in_flight = deque()
+    for start, end in chunks:
+        if len(in_flight) >= max_in_flight:
+            yield in_flight.popleft().result()
+        in_flight.append(executor.submit(classify_chunk, path, start, end, route))
+    while in_flight:
+        yield in_flight.popleft().result()
+
+def classify_file(path, workers=None, chunk_size=64 * 2**20, output_dir=None):
+    totals = Counter()
+    output_files = {}
+    chunks = chunk_boundaries(path, chunk_size)
+    workers = workers or os.cpu_count()
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as executor:
+            results = _ordered_results(executor, path, chunks, output_dir is not None, 2 * workers)
+            # results arrive in submission order, so routed files keep the input order
+            for counts, routed in results:
+                totals.update(counts)
+                for card_type, text in routed.items():
+                    if card_type not in output_files:
+                        output_files[card_type] = open(os.path.join(output_dir, f"{card_type}.txt"), "w")
+                    output_files[card_type].write(text)
+    finally:
+        for output_file in output_files.values():
+            output_file.close()
+    return dict(totals)
+
+def classify_file_single_process(path):
+    card_factory = CardFactory()
+    totals = Counter()
+    with open(path, newline="\n") as card_file:  # split on "\n" only, like the workers
+        for card_number in card_numbers(card_file):
+            totals[card_factory.card_type_name(card_factory.classifier.classify(card_number))] += 1
+    return dict(totals)
+
+def generate_card_file(path, n_numbers, seed=42):
+    generator = random.Random(seed)
+    prefixes = ["4", "51", "55", "2221", "2720", "62", "6", "9"]
+    with open(path, "w") as card_file:
+        for _ in range(n_numbers):
+            prefix = generator.choice(prefixes)
+            card_file.write(prefix + str(generator.randrange(10 ** (15 - len(prefix)), 10 ** (16 - len(prefix)))) + "\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify a file of card numbers (one per line) by card type.")
+    parser.add_argument("input", help="file with one card number per line")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="chunk size in MB (default: 64)")
+    parser.add_argument("--output-dir", help="write the numbers of every card type to <output-dir>/<type>.txt")
+    parser.add_argument("--generate", type=int, metavar="N", help="first write N random card numbers to the input")
+    parser.add_argument("--benchmark", action="store_true", help="compare against a single-process loop")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        generate_card_file(args.input, args.generate)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    totals = classify_file(args.input, args.workers, args.chunk_size * 2**20, args.output_dir)
+    elapsed = time.perf_counter() - start
+    for card_type, count in sorted(totals.items()):
+        print(f"{card_type}: {count:,}")
+    print(f"Classified {sum(totals.values()):,} numbers in {elapsed:.2f}s")
+
+    if args.benchmark:
+        start = time.perf_counter()
+        single = classify_file_single_process(args.input)
+        single_elapsed = time.perf_counter() - start
+        if single != totals:
+            print(f"Single process results differ: {single}", file=sys.stderr)
+            return 1
+        print(f"Single process: {single_elapsed:.2f}s, {args.workers or os.cpu_count()} processes: {elapsed:.2f}s "
+              f"({single_elapsed / elapsed:.1f}x)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,24 +36,31 @@ class UnionPay:
         print("Withdraw money from an ATM using UnionPay Card")
 
 # Usage
+if __name__ == "__main__":
+    card_number = "4123456"
 
-card_number = "123456"
+    if card_number.startswith("4"):
+        card = Visa()
+    elif card_number.startswith("5"):
+        card = MasterCard()
+    elif card_number.startswith("6"):
+        card = UnionPay()
 
-if card_number.startswith("4"):
-    card = Visa()
-elif card_number.startswith("5"):
-    card = MasterCard()
-elif card_number.startswith("6"):
-    card = UnionPay()
-
-card.withdraw()
+    card.withdraw()
 
 # the code above is hard-coded and inflexible.
 # we also force the client to know the exact type of object they want to create, which is not ideal.
 
 # apply the Factory Method pattern to solve this problem.
 
+import heapq
 from abc import ABC, abstractmethod
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # optional, only needed for the vectorized bulk classification
+    np = None
 
 class Card(ABC):
     @abstractmethod
@@ -77,20 +84,231 @@ class ICardFactory(ABC):
     def create_card(self, card_number):
         pass
 
+# IIN (Issuer Identification Number) classification
+# Real BIN/IIN tables hold tens of thousands of ranges with prefixes of different lengths.
+# The ranges of each length are first flattened into disjoint segments (where ranges of
+# one length overlap, the narrower one wins, so a sub-range carves a hole in its parent).
+# Each segment (low, high) is then split into the fewest prefixes that cover it (like CIDR
+# blocks) and compiled into a flat digit trie:
+# children[node * 10 + digit] is the next node, codes[node] the card type ending there and
+# lengths[node] the length of the range it came from (a covering prefix can be shorter than it).
+# A lookup walks at most one node per digit and keeps the match from the longest range.
+UNKNOWN_CARD = 0
+
+class IINClassifier:
+    def __init__(self, ranges):
+        # ranges: iterable of (low, high, code) with low/high digit strings of the same length
+        self.ranges = sorted(ranges, key=lambda iin_range: len(iin_range[0]))
+        self.max_prefix_length = max((len(low) for low, _, _ in self.ranges), default=0)
+        by_length = {}
+        for low, high, code in self.ranges:
+            if len(low) != len(high) or not (low.isdigit() and high.isdigit()) or low > high:
+                raise ValueError(f"Invalid IIN range {low}-{high}")
+            by_length.setdefault(len(low), []).append((int(low), int(high), code))
+        # length -> disjoint (low, high, code) segments, shared by the trie and the NumPy tables
+        self._segments = {length: self._flatten(entries) for length, entries in sorted(by_length.items())}
+        self._children = array("i", [0] * 10)
+        self._codes = array("b", [UNKNOWN_CARD])
+        self._lengths = array("b", [0])
+        for length, segments in self._segments.items():
+            for low, high, code in segments:
+                for prefix in self._covering_prefixes(str(low).zfill(length), str(high).zfill(length)):
+                    self._insert(prefix, code, length)
+        self._tables = self._range_tables()
+
+    @staticmethod
+    def _flatten(entries):
+        # sweep over the range boundaries with the covering ranges in a heap ordered by width
+        # (ties go to the range listed last) and emit the winner of every elementary interval
+        boundaries = sorted({low for low, _, _ in entries} | {high + 1 for _, high, _ in entries})
+        by_start = sorted(range(len(entries)), key=lambda index: entries[index][0])
+        active = []  # (width, -index, high, code)
+        segments = []
+        next_entry = 0
+        for start, stop in zip(boundaries, boundaries[1:]):
+            while next_entry < len(by_start) and entries[by_start[next_entry]][0] <= start:
+                index = by_start[next_entry]
+                low, high, code = entries[index]
+                heapq.heappush(active, (high - low, -index, high, code))
+                next_entry += 1
+            while active and active[0][2] < start:
+                heapq.heappop(active)  # ended before this interval
+            if not active:
+                continue
+            code = active[0][3]
+            if segments and segments[-1][1] == start - 1 and segments[-1][2] == code:
+                segments[-1] = (segments[-1][0], stop - 1, code)
+            else:
+                segments.append((start, stop - 1, code))
+        return segments
+
+    @staticmethod
+    def _covering_prefixes(low, high):
+        # "2221"-"2720" -> 2221..2229, 223..229, 23..26, 270, 271, 2720
+        if low == high:
+            return [low]
+        if low[-1] == "0" and high[-1] == "9":
+            shorter = IINClassifier._covering_prefixes(low[:-1], high[:-1]) if len(low) > 1 else [""]
+            return shorter
+        if low[:-1] == high[:-1]:
+            return [low[:-1] + str(digit) for digit in range(int(low[-1]), int(high[-1]) + 1)]
+        prefixes = []
+        if low[-1] != "0":
+            prefixes += [low[:-1] + str(digit) for digit in range(int(low[-1]), 10)]
+            low = str(int(low[:-1]) + 1).zfill(len(low) - 1) + "0"
+        tail = []
+        if high[-1] != "9":
+            tail = [high[:-1] + str(digit) for digit in range(0, int(high[-1]) + 1)]
+            high = str(int(high[:-1]) - 1).zfill(len(high) - 1) + "9"
+        if low <= high:
+            prefixes += IINClassifier._covering_prefixes(low, high)
+        return prefixes + tail
+
+    def _insert(self, prefix, code, range_length):
+        node = 0
+        for char in prefix:
+            slot = node * 10 + ord(char) - 48
+            if self._children[slot] == 0:
+                self._children[slot] = len(self._codes)
+                self._children.extend([0] * 10)
+                self._codes.append(UNKNOWN_CARD)
+                self._lengths.append(0)
+            node = self._children[slot]
+        if range_length >= self._lengths[node]:
+            self._codes[node] = code
+            self._lengths[node] = range_length
+
+    def classify(self, card_number):
+        children, codes, lengths = self._children, self._codes, self._lengths
+        card_number = str(card_number)
+        node, code, best_length = 0, codes[0], 0
+        for char in card_number[:self.max_prefix_length]:
+            digit = ord(char) - 48
+            if not 0 <= digit <= 9:
+                break
+            node = children[node * 10 + digit]
+            if node == 0:
+                break
+            range_length = lengths[node]
+            # a range only matches numbers with at least as many digits as its bounds
+            if range_length >= best_length and range_length <= len(card_number) and range_length:
+                code, best_length = codes[node], range_length
+        return code
+
+    def classify_many(self, card_numbers):
+        # NumPy integer arrays take the vectorized path, anything else is walked number by number
+        if np is not None and isinstance(card_numbers, np.ndarray) and card_numbers.dtype.kind in "iu":
+            return self._classify_array(card_numbers)
+        return array("b", map(self.classify, card_numbers))
+
+    def _range_tables(self):
+        # per prefix length: sorted, disjoint segment starts, ends and codes for np.searchsorted
+        compiled = []
+        for length, segments in self._segments.items():
+            if segments:
+                starts, ends, codes = zip(*segments)
+                compiled.append((length, starts, ends, codes))
+        return compiled
+
+    def _classify_array(self, card_numbers):
+        numbers = card_numbers.astype(np.int64, copy=False)
+        powers = 10 ** np.arange(19, dtype=np.int64)
+        digits = np.searchsorted(powers, numbers, side="right")  # number of digits
+        result = np.zeros(len(numbers), dtype=np.int8)
+        # shorter prefixes first, so a longer matching prefix overwrites them
+        for length, starts, ends, codes in self._tables:
+            long_enough = digits >= length
+            prefixes = numbers // powers[np.clip(digits - length, 0, 18)]
+            starts, ends, codes = np.array(starts), np.array(ends), np.array(codes, dtype=np.int8)
+            index = np.searchsorted(starts, prefixes, side="right") - 1
+            safe_index = np.clip(index, 0, len(starts) - 1)
+            matched = long_enough & (index >= 0) & (prefixes <= ends[safe_index])
+            result[matched] = codes[safe_index[matched]]
+        return result
+
+VISA, MASTERCARD, UNIONPAY = 1, 2, 3
+
+DEFAULT_IIN_RANGES = [
+    ("4", "4", VISA),
+    ("5", "5", MASTERCARD),
+    ("2221", "2720", MASTERCARD),
+    ("6", "6", UNIONPAY),
+]
+
 class CardFactory(ICardFactory):
+    card_types = {VISA: Visa, MASTERCARD: MasterCard, UNIONPAY: UnionPay}
+
+    def __init__(self, iin_ranges=DEFAULT_IIN_RANGES):
+        self.classifier = IINClassifier(iin_ranges)
+
     def create_card(self, card_number):
-        if card_number.startswith("4"):
-            return Visa()
-        elif card_number.startswith("5"):
-            return MasterCard()
-        elif card_number.startswith("6"):
-            return UnionPay()
+        card_type = self.card_types.get(self.classifier.classify(card_number))
+        if card_type is not None:
+            return card_type()
+
+    def classify_many(self, card_numbers):
+        # card type codes (see card_types, 0 for unknown) for many card numbers at once
+        return self.classifier.classify_many(card_numbers)
+
+    def card_type_name(self, code):
+        card_type = self.card_types.get(code)
+        return card_type.__name__ if card_type is not None else "Unknown"
+
+def check_nested_ranges(n_numbers=55_000, seed=7):
+    # the trie walk and the vectorized path must agree when ranges nest or overlap
+    import random
+
+    if np is None:
+        print("NumPy not installed, skipping the vectorized comparison")
+        return
+    generator = random.Random(seed)
+    ranges = []
+    for length in (4, 5, 6):
+        # overlapping and nested ranges, within one length and across lengths
+        for code in range(40):
+            low, high = sorted(generator.sample(range(10 ** (length - 1), 10 ** length), 2))
+            ranges.append((str(low), str(high), code % 3 + 1))
+    classifier = IINClassifier(ranges)
+    numbers = [generator.randrange(10**15, 10**16) for _ in range(n_numbers)]
+    scalar = list(classifier.classify_many([str(number) for number in numbers]))
+    vectorized = list(classifier.classify_many(np.array(numbers, dtype=np.int64)))
+    mismatches = sum(a != b for a, b in zip(scalar, vectorized))
+    if mismatches:
+        raise AssertionError(f"{mismatches} of {n_numbers} numbers classified differently")
+    print(f"Nested ranges: trie walk and vectorized path agree on {n_numbers:,} numbers")
+
+def benchmark_classification(n_numbers=1_000_000):
+    import random
+    import time
+
+    generator = random.Random(42)
+    numbers = [generator.randrange(10**15, 10**16) for _ in range(n_numbers)]
+    card_factory = CardFactory()
+
+    strings = [str(number) for number in numbers]
+    start = time.perf_counter()
+    card_factory.classify_many(strings)
+    print(f"Trie walk:  {n_numbers / (time.perf_counter() - start):,.0f} numbers/s")
+
+    if np is not None:
+        vector = np.array(numbers, dtype=np.int64)
+        start = time.perf_counter()
+        codes = card_factory.classify_many(vector)
+        print(f"Vectorized: {n_numbers / (time.perf_counter() - start):,.0f} numbers/s")
+        assert list(codes[:1000]) == list(card_factory.classify_many(strings[:1000]))
 
 # Usage
-card_number = "123456"
-card_factory = CardFactory()
-card = card_factory.create_card(card_number)
-card.withdraw()
+if __name__ == "__main__":
+    card_number = "4123456"
+    card_factory = CardFactory()
+    card = card_factory.create_card(card_number)
+    card.withdraw()
+    card_factory.create_card("2720991234567890").withdraw()  # 2-series MasterCard
+    print(list(card_factory.classify_many(["4111111111111111", "5500000000000004", "9000000000000000"])))
+    classifier = IINClassifier([("14444", "20478", VISA), ("136851", "147266", MASTERCARD)])
+    print(card_factory.card_type_name(classifier.classify("1449744924612387")))  # MasterCard, the 6-digit range
+    check_nested_ranges()
+    benchmark_classification()
 
 # in this code, we've defined a creator class with a factory method that returns a Card object.
-# we removed the hard-coded logic from the client code, allowing the client to create objects of various types without knowing the exact type of object they want to create.
\ No newline at end of file
+# we removed the hard-coded logic from the client code, allowing the client to create objects of various types without knowing the exact type of object they want to create.
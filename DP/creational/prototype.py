@@ -44,6 +44,8 @@ report_2.display_report()
 
 
 import copy
+import mmap
+import os
 from abc import ABC, abstractmethod
 
 class ReportPrototype(ABC):
@@ -56,39 +58,134 @@ class ReportPrototype(ABC):
         pass
     
     def read_data_from_file(self, filename):
-        # Simulate reading data from a file
-        # Inefficient and slow operation
-        data = f"Data from {filename}"
-        return data
-
+        # Maps the file read-only instead of reading it, the pages are loaded lazily by the OS
+        # and shared by every report that points at them. A missing file raises FileNotFoundError.
+        with open(filename, "rb") as report_file:
+            if os.fstat(report_file.fileno()).st_size == 0:
+                return memoryview(b"").toreadonly()
+            mapped = mmap.mmap(report_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped).toreadonly()
+
+# Report data is copy-on-write: clones share one buffer and a clone only
+# copies it (into its own bytearray) the first time it changes the data.
 class Report(ReportPrototype):
     def __init__(self, filename):
         # heavy I/O call during initialization
-        self.data = self.read_data_from_file(filename)
+        self._buffer = self.read_data_from_file(filename)
+        self._exclusive = False  # a read-only mapping is never written in place
+
+    @classmethod
+    def from_data(cls, data):
+        # a report over data that is already in memory, no file involved
+        report = cls.__new__(cls)
+        report.set_data(data)
+        return report
+
+    @property
+    def data(self):
+        # read-only view, changes go through set_data/write so they can copy first
+        return memoryview(self._buffer).toreadonly()
+
+    @data.setter
+    def data(self, data):
+        self.set_data(data)
+
+    def set_data(self, data):
+        self._buffer = bytes(data.encode() if isinstance(data, str) else data)
+        self._exclusive = False
+
+    def write(self, offset, chunk):
+        if not self._exclusive:
+            self._buffer = bytearray(self._buffer)  # the one copy, on the first write
+            self._exclusive = True
+        if offset + len(chunk) > len(self._buffer):
+            # a bytearray cannot resize while views from data are alive, so growing builds a new one
+            # (views taken earlier keep the old contents, in-place writes show through them)
+            grown = bytearray(offset + len(chunk))
+            grown[:len(self._buffer)] = self._buffer
+            self._buffer = grown
+        self._buffer[offset:offset + len(chunk)] = chunk
 
     def __copy__(self):
-        # Shallow copy implementation
-        new_report = self.__class__(self.data)
+        # O(1): the clone shares the buffer and neither side may write to it in place anymore
+        new_report = self.__class__.__new__(self.__class__)
+        new_report._buffer = self._buffer
+        new_report._exclusive = self._exclusive = False
         return new_report
 
-    def __deepcopy__(self):
-        # Deep copy implementation
-        new_report = copy.copy(self)
-        new_report.data = copy.deepcopy(self.data)
+    def __deepcopy__(self, memo):
+        # sharing is safe for a deep copy too, copy-on-write keeps the clones independent
+        new_report = self.__copy__()
+        memo[id(self)] = new_report
         return new_report
 
     def display_report(self):
-        print(self.data)
+        print(bytes(self._buffer).decode(errors="replace"))
+
+# Prototype Registry: loads every source once and hands out clones
+class ReportRegistry:
+    def __init__(self):
+        self._prototypes = {}
+        self.loads = 0
+
+    def register(self, name, report: Report):
+        self._prototypes[name] = report
+
+    def prototype(self, filename) -> Report:
+        report = self._prototypes.get(filename)
+        if report is None:
+            report = self._prototypes[filename] = Report(filename)
+            self.loads += 1
+        return report
+
+    def clone(self, filename) -> Report:
+        return copy.copy(self.prototype(filename))
 
-# Create a prototype instance with data
-prototype_report = Report("Data from report1.txt")
+# Create a prototype instance with data (simulated, the demo has no report files)
+prototype_report = Report.from_data("Data from report1.txt")
 
 # Clone the prototype using custom copy and deep copy methods
 report_1 = copy.copy(prototype_report)
-report_1.data = "Data from report1.txt"
+report_1.set_data("Data from report1.txt")
 report_1.display_report()
 
 report_2 = copy.deepcopy(prototype_report)
-report_2.data = "Data from report2.txt"
+report_2.set_data("Data from report2.txt")
 report_2.display_report()
 
+# Registry: the source is loaded once, every clone shares its buffer
+registry = ReportRegistry()
+registry.register("report3.txt", Report.from_data("Data from report3.txt"))
+report_3 = registry.clone("report3.txt")
+report_4 = registry.clone("report3.txt")
+report_4.write(0, b"Edit")  # report_4 gets its own copy, report_3 and the prototype are untouched
+report_3.display_report()
+report_4.display_report()
+
+def benchmark_cloning(size_mb=50, n_clones=10_000):
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "big_report.txt")
+        with open(filename, "wb") as report_file:
+            report_file.write(os.urandom(size_mb * 2**20))
+
+        start = time.perf_counter()
+        for _ in range(20):
+            with open(filename, "rb") as report_file:
+                report_file.read()
+        per_read = (time.perf_counter() - start) / 20
+        print(f"Re-reading the file: {per_read * 1e3:.2f} ms per report")
+
+        registry = ReportRegistry()
+        registry.prototype(filename)
+        start = time.perf_counter()
+        clones = [registry.clone(filename) for _ in range(n_clones)]
+        per_clone = (time.perf_counter() - start) / n_clones
+        print(f"Cloning from the registry: {per_clone * 1e6:.2f} us per report ({size_mb} MB each, "
+              f"{registry.loads} load for {n_clones:,} clones)")
+        del clones
+
+if __name__ == "__main__":
+    benchmark_cloning()
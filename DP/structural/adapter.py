@@ -21,11 +21,80 @@ By the end of this module, you will have a clear understanding of how to use the
 between objects with different interfaces, ensuring compatibility and smooth integration in your software systems.
 """
 
+import asyncio
+import io
+import itertools
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from xml.etree import ElementTree
 
 # Adapter Interface
 
 
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+# Result Cursor
+# Streams a result set in fixed-size batches instead of materializing it,
+# fetch_batch(batch_size) returns the next list of rows or an empty list at the end.
+class ResultCursor:
+    def __init__(self, columns, fetch_batch, batch_size=1000, on_close=None):
+        self.columns = columns
+        self.batch_size = batch_size
+        self._fetch_batch = fetch_batch
+        self._on_close = on_close
+        self.closed = False
+
+    def fetchmany(self, size=None):
+        if self.closed:
+            return []
+        batch = self._fetch_batch(size or self.batch_size)
+        if not batch:
+            self.close()
+        return batch
+
+    def batches(self):
+        try:
+            while True:
+                batch = self.fetchmany()
+                if not batch:
+                    return
+                yield batch
+        finally:
+            self.close()
+
+    def __iter__(self):
+        for batch in self.batches():
+            yield from batch
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            if self._on_close is not None:
+                self._on_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 # Database Contract (Abstract Class)
 class Database(ABC):
     @abstractmethod
@@ -36,20 +105,418 @@ class Database(ABC):
     def execute_query(self, query):
         pass
 
+    @abstractmethod
+    def execute_many(self, query, rows, chunk_size=1000):
+        # runs a parameterized statement once per row, chunk_size rows per round trip
+        pass
+
+    @abstractmethod
+    def cursor(self, query, batch_size=1000):
+        # returns a ResultCursor that streams the result set batch_size rows at a time
+        pass
+
+    # DB-API style of the placeholders the backend binds: "qmark" ("?") or "dollar" ("$1", "$2", ...)
+    paramstyle = "qmark"
+
+    def ping(self):
+        # Health check used by connection pools, override when the backend can tell
+        return True
+
+    def close(self):
+        pass
+
+    # Prepared statements are cached per Database object, i.e. per connection.
+    statement_cache_size = 128
+
+    def prepare(self, query):
+        if "_statements" not in self.__dict__:
+            self._statements = LRUCache(self.statement_cache_size)
+            self._statement_stats = {}
+        stats = self._statement_stats.setdefault(query, {"hits": 0, "misses": 0})
+        statement = self._statements.get(query)
+        if statement is not None:
+            stats["hits"] += 1
+            return statement
+        stats["misses"] += 1
+        statement = self._prepare_statement(query)
+        evicted = self._statements.put(query, statement)
+        if evicted is not None:
+            evicted[1].close()
+            self._statement_stats.pop(evicted[0], None)  # stats are bounded by the cache too
+        return statement
+
+    def _prepare_statement(self, query):
+        raise NotImplementedError(f"{type(self).__name__} does not support prepared statements")
+
+    def statement_stats(self):
+        stats = {}
+        for query, counts in self.__dict__.get("_statement_stats", {}).items():
+            total = counts["hits"] + counts["misses"]
+            stats[query] = dict(counts, hit_rate=counts["hits"] / total)
+        return stats
+
+    def _close_statements(self):
+        if "_statements" in self.__dict__:
+            for statement in self._statements.values():
+                statement.close()
+            self._statements.clear()
+
+
+# Prepared Statement
+# Parameters are always bound by the driver, never formatted into the SQL text.
+class PreparedStatement:
+    def __init__(self, query, execute, execute_many=None, close=None):
+        self.query = query
+        self._execute = execute
+        self._execute_many = execute_many
+        self._close = close
+        self.executions = 0
+
+    def execute(self, params=()):
+        self.executions += 1
+        return self._execute(params)
+
+    def execute_many(self, rows, chunk_size=1000):
+        if self._execute_many is not None:
+            self.executions += 1
+            return self._execute_many(rows, chunk_size)
+        total = 0
+        for params in rows:
+            self.execute(params)
+            total += 1
+        return total
+
+    def close(self):
+        if self._close is not None:
+            self._close()
+
 
 
 # PostgreSQL Database (Adheres to the Database Contract)
 class PostgreSQLDatabase(Database):
+    paramstyle = "dollar"
+
     def connect(self, host, username, password, database_name):
         print(f"Connected to PostgreSQL database on {host} as {username}")
 
     def execute_query(self, query):
         print(f"Executing PostgreSQL Query: {query}")
 
+    def execute_many(self, query, rows, chunk_size=1000):
+        total = 0
+        for chunk in chunked(rows, chunk_size):
+            print(f"Executing PostgreSQL batch of {len(chunk)} rows: {query}")
+            total += len(chunk)
+        return total
+
+    def cursor(self, query, batch_size=1000):
+        print(f"DECLARE result_cursor CURSOR FOR {query}")
+        print(f"FETCH {batch_size} FROM result_cursor")
+        return ResultCursor([], lambda size: [], batch_size)
+
+    _statement_counter = itertools.count(1)
+
+    def _prepare_statement(self, query):
+        name = f"stmt_{next(self._statement_counter)}"
+        print(f"PREPARE {name} AS {query}")
+
+        def execute(params):
+            print(f"EXECUTE {name}({', '.join(map(repr, params))})")
+        return PreparedStatement(query, execute, close=lambda: print(f"DEALLOCATE {name}"))
+
+# SQLite Database (Adheres to the Database Contract)
+# A real, local backend used as a stand-in for benchmarks, host/username/password are ignored.
+class SQLiteDatabase(Database):
+    def __init__(self):
+        self._connection = None
+
+    def connect(self, host, username, password, database_name):
+        # sqlite3 compiles each distinct SQL text once and keeps it in its own
+        # statement cache, sized here to match our prepared statement cache.
+        self._connection = sqlite3.connect(database_name, check_same_thread=False,
+                                           cached_statements=self.statement_cache_size)
+
+    def execute_query(self, query):
+        cursor = self._connection.execute(query)
+        rows = cursor.fetchall()
+        self._connection.commit()
+        return rows
+
+    def execute_many(self, query, rows, chunk_size=1000):
+        total = 0
+        for chunk in chunked(rows, chunk_size):
+            with self._connection:  # one transaction per chunk
+                self._connection.executemany(query, chunk)
+            total += len(chunk)
+        return total
+
+    def cursor(self, query, batch_size=1000):
+        cursor = self._connection.execute(query)
+        columns = [column[0] for column in cursor.description or ()]
+        return ResultCursor(columns, cursor.fetchmany, batch_size, on_close=cursor.close)
+
+    def _prepare_statement(self, query):
+        connection = self._connection
+
+        def execute(params):
+            rows = connection.execute(query, params).fetchall()
+            connection.commit()
+            return rows
+
+        def execute_many(rows, chunk_size):
+            total = 0
+            for chunk in chunked(rows, chunk_size):
+                with connection:
+                    connection.executemany(query, chunk)
+                total += len(chunk)
+            return total
+        return PreparedStatement(query, execute, execute_many)
+
+    def ping(self):
+        if self._connection is None:
+            return False
+        try:
+            self._connection.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def interrupt(self):
+        # aborts the statement currently running on this connection, safe to call from any thread
+        if self._connection is not None:
+            self._connection.interrupt()
+
+    def close(self):
+        self._close_statements()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+# Bounded LRU cache with hit/miss counters
+class LRUCache:
+    def __init__(self, max_size=256):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        evicted = None
+        if len(self._entries) > self.max_size:
+            evicted = self._entries.popitem(last=False)
+        return evicted
+
+    def values(self):
+        return list(self._entries.values())
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+
+# SQL Tokenizer
+# Splits a statement into tokens so that rewrites only ever touch keywords
+# and punctuation, never the inside of string literals or quoted identifiers.
+SQLToken = namedtuple("SQLToken", ["kind", "text"])
+
+_MYSQL_TOKEN_PATTERN = re.compile(r"""
+    (?P<whitespace>\s+)
+  | (?P<comment>--[^\n]*|\#[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\]|\\.|'')*')
+  | (?P<dquoted>"(?:[^"\\]|\\.|"")*")
+  | (?P<identifier>`(?:[^`]|``)*`)
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<placeholder>\?)
+  | (?P<operator><=>|<=|>=|<>|!=|\|\||:=|[-+*/%=<>!~&|^])
+  | (?P<punctuation>[(),.;])
+  | (?P<other>[^'"`])  # anything else (@var, @@session.x, ...) passes through unchanged
+""", re.VERBOSE | re.DOTALL)
+
+class SQLSyntaxError(ValueError):
+    pass
+
+def tokenize_mysql(query):
+    tokens = []
+    position = 0
+    while position < len(query):
+        match = _MYSQL_TOKEN_PATTERN.match(query, position)
+        if match is None:
+            raise SQLSyntaxError(f"Unexpected character {query[position]!r} at position {position}")
+        tokens.append(SQLToken(match.lastgroup, match.group()))
+        position = match.end()
+    return tokens
+
+
+# MySQL -> PostgreSQL dialect translation over the token stream
+class MySQLToPostgreSQLTranslator:
+    FUNCTION_RENAMES = {"IFNULL": "COALESCE", "RAND": "RANDOM"}
+    MYSQL_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+    POSTGRES_ESCAPES = {"\b": "\\b", "\n": "\\n", "\r": "\\r", "\t": "\\t", "\\": "\\\\", "'": "\\'"}
+
+    def __init__(self, paramstyle="dollar"):
+        if paramstyle not in ("dollar", "qmark"):
+            raise ValueError(f"Unsupported paramstyle {paramstyle!r}")
+        self.paramstyle = paramstyle
+
+    def translate(self, query):
+        return self.translate_statement(query)[0]
+
+    def translate_statement(self, query):
+        # returns (sql, parameter_order), parameter_order lists the caller's parameter
+        # index for every placeholder of the translated statement, None if unchanged
+        tokens = [self._rewrite_token(token) for token in tokenize_mysql(query)]
+        tokens = self._rewrite_placeholders(tokens)
+        tokens = self._rewrite_functions(tokens)
+        tokens = self._rewrite_limit(tokens)
+        numbers = [int(token.text[1:]) - 1 for token in tokens if token.kind == "placeholder"]
+        if self.paramstyle == "qmark":
+            # "?" binds by position, so the parameters follow the placeholders around instead
+            tokens = [SQLToken("placeholder", "?") if token.kind == "placeholder" else token
+                      for token in tokens]
+            order = tuple(numbers) if numbers != sorted(numbers) else None
+        else:
+            order = None
+        return "".join(token.text for token in tokens), order
+
+    def _rewrite_token(self, token):
+        if token.kind == "identifier":
+            name = token.text[1:-1].replace("``", "`")
+            return SQLToken("identifier", '"' + name.replace('"', '""') + '"')
+        if token.kind in ("string", "dquoted"):
+            value = self._decode_mysql_string(token.text[1:-1], token.text[0])
+            return SQLToken("string", self._encode_postgres_string(value))
+        if token.kind == "comment" and token.text.startswith("#"):
+            return SQLToken("comment", "--" + token.text[1:])
+        return token
+
+    def _decode_mysql_string(self, body, quote):
+        chars = []
+        index = 0
+        while index < len(body):
+            char = body[index]
+            if char == "\\" and index + 1 < len(body):
+                escaped = body[index + 1]
+                if escaped in "%_":
+                    chars.append("\\" + escaped)  # MySQL keeps these for LIKE patterns
+                else:
+                    chars.append(self.MYSQL_ESCAPES.get(escaped, escaped))
+                index += 2
+            elif char == quote and body[index + 1:index + 2] == quote:
+                chars.append(quote)
+                index += 2
+            else:
+                chars.append(char)
+                index += 1
+        return "".join(chars)
+
+    def _encode_postgres_string(self, value):
+        if any(char in value for char in "\b\n\r\t"):
+            # E'' strings are the only way to spell control characters in PostgreSQL
+            return "E'" + "".join(self.POSTGRES_ESCAPES.get(char, char) for char in value) + "'"
+        return "'" + value.replace("'", "''") + "'"
+
+    def _rewrite_functions(self, tokens):
+        result = list(tokens)
+        for index, token in enumerate(result):
+            if token.kind == "word" and token.text.upper() in self.FUNCTION_RENAMES:
+                following = self._next_significant(result, index)
+                if following is not None and result[following].text == "(":
+                    result[index] = SQLToken("word", self.FUNCTION_RENAMES[token.text.upper()])
+        return result
+
+    def _rewrite_placeholders(self, tokens):
+        # MySQL binds "?" by position, PostgreSQL numbers its parameters "$1", "$2", ...
+        # (numbered in both styles here, so later rewrites can move them around)
+        numbers = itertools.count(1)
+        return [SQLToken("placeholder", f"${next(numbers)}") if token.kind == "placeholder" else token
+                for token in tokens]
+
+    def _rewrite_limit(self, tokens):
+        # MySQL "LIMIT offset, count" becomes "LIMIT count OFFSET offset"
+        result = list(tokens)
+        for index, token in enumerate(result):
+            if token.kind != "word" or token.text.upper() != "LIMIT":
+                continue
+            first = self._next_significant(result, index)
+            comma = self._next_significant(result, first) if first is not None else None
+            second = self._next_significant(result, comma) if comma is not None else None
+            if second is None or result[comma].text != ",":
+                continue
+            # placeholders are numbered by now, so swapping them keeps the bindings intact
+            if {result[first].kind, result[second].kind} - {"number", "placeholder"}:
+                continue
+            offset, count = result[first], result[second]
+            result[first] = count
+            result[comma] = SQLToken("word", " OFFSET ")
+            for between in range(comma + 1, second):
+                result[between] = SQLToken("whitespace", "")
+            result[second] = offset
+        return result
+
+    @staticmethod
+    def _next_significant(tokens, index):
+        for position in range(index + 1, len(tokens)):
+            if tokens[position].kind not in ("whitespace", "comment"):
+                return position
+        return None
+
+
 # MySQL Adapter (Implements the Adapter Interface)
 class MySQLAdapter(Database):
-    def __init__(self, database:Database):
+    def __init__(self, database:Database, translation_cache_size=256):
         self._database = database
+        # placeholders are written in the style the wrapped backend actually binds
+        self._translator = MySQLToPostgreSQLTranslator(database.paramstyle)
+        self.translation_cache = LRUCache(translation_cache_size)
+
+    @property
+    def paramstyle(self):
+        return "qmark"  # callers always speak MySQL
+
+    def translate(self, query:str):
+        return self.translate_statement(query)[0]
+
+    def translate_statement(self, query:str):
+        # Leading/trailing whitespace is the only normalization that is safe
+        # without tokenizing, anything inside the statement may be a literal.
+        key = query.strip()
+        translated = self.translation_cache.get(key)
+        if translated is None:
+            translated = self._translator.translate_statement(key)
+            self.translation_cache.put(key, translated)
+        return translated
+
+    @staticmethod
+    def _reorder(order, params):
+        return params if order is None else tuple(params[index] for index in order)
 
     def connect(self, host, username, password, database_name):
         # Adapt MySQL connection details to PostgreSQL
@@ -62,8 +529,879 @@ class MySQLAdapter(Database):
 
     def execute_query(self, query:str):
         # Adapt MySQL query to PostgreSQL syntax
-        postgres_query = query.replace("LIMIT", "LIMIT ALL")
-        self._database.execute_query(postgres_query)
+        postgres_query = self.translate(query)
+        return self._database.execute_query(postgres_query)
+
+    def execute_many(self, query, rows, chunk_size=1000):
+        # translated once for the whole batch
+        translated, order = self.translate_statement(query)
+        if order is not None:
+            rows = (self._reorder(order, params) for params in rows)
+        return self._database.execute_many(translated, rows, chunk_size)
+
+    def cursor(self, query, batch_size=1000):
+        return self._database.cursor(self.translate(query), batch_size)
+
+    def prepare(self, query):
+        # prepared (and cached) by the wrapped database, in its own dialect
+        translated, order = self.translate_statement(query)
+        statement = self._database.prepare(translated)
+        if order is None:
+            return statement
+        return PreparedStatement(
+            translated,
+            lambda params: statement.execute(self._reorder(order, params)),
+            lambda rows, chunk_size: statement.execute_many(
+                (self._reorder(order, params) for params in rows), chunk_size))
+
+    def statement_stats(self):
+        return self._database.statement_stats()
+
+    def ping(self):
+        return self._database.ping()
+
+    def close(self):
+        self._database.close()
+
+
+# Connection Pool
+# Keeps up to max_size connected Database objects around, hands them out one
+# caller at a time and takes them back. Idle connections beyond min_size are
+# closed after idle_timeout seconds, and every checkout is health checked.
+class PoolTimeoutError(Exception):
+    pass
+
+class ConnectionPool:
+    def __init__(self, database_factory, connect_args, min_size=1, max_size=10,
+                 idle_timeout=300.0, health_check=True):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self._database_factory = database_factory
+        self._connect_args = connect_args
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self._idle = deque()  # (database, last_used), most recently used on the right
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.metrics = {"created": 0, "checkouts": 0, "waits": 0, "wait_time": 0.0,
+                        "max_waiters": 0, "timeouts": 0, "unhealthy": 0, "reaped": 0}
+        self._waiters = 0
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+            self._size += 1
+
+    def _create(self):
+        database = self._database_factory()
+        database.connect(*self._connect_args)
+        with self._condition:
+            self.metrics["created"] += 1
+        return database
+
+    def _reap_idle(self, now):
+        # called with the lock held, the oldest idle connections are on the left
+        reaped = []
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            reaped.append(self._idle.popleft()[0])
+            self._size -= 1
+            self.metrics["reaped"] += 1
+        return reaped
+
+    def acquire(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            database, create = None, False
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Pool is closed")
+                reaped = self._reap_idle(time.monotonic())
+                if self._idle:
+                    database = self._idle.pop()[0]
+                elif self._size < self.max_size:
+                    self._size += 1
+                    create = True
+                else:
+                    self._wait(deadline)
+                    continue
+            for stale in reaped:
+                stale.close()
+
+            if create:
+                try:
+                    database = self._create()
+                except BaseException:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+            elif self.health_check and not database.ping():
+                self._discard(database, unhealthy=True)
+                continue
+            with self._condition:
+                self.metrics["checkouts"] += 1
+            return database
+
+    def _wait(self, deadline):
+        # called with the lock held
+        self._waiters += 1
+        self.metrics["waits"] += 1
+        self.metrics["max_waiters"] = max(self.metrics["max_waiters"], self._waiters)
+        started = time.monotonic()
+        try:
+            remaining = None if deadline is None else deadline - started
+            if remaining is not None and remaining <= 0 or not self._condition.wait(remaining):
+                self.metrics["timeouts"] += 1
+                raise PoolTimeoutError(f"No connection available within the timeout (max_size={self.max_size})")
+        finally:
+            self._waiters -= 1
+            self.metrics["wait_time"] += time.monotonic() - started
+
+    def release(self, database):
+        with self._condition:
+            if not self._closed:
+                self._idle.append((database, time.monotonic()))
+                self._condition.notify()
+                return
+            self._size -= 1
+        database.close()
+
+    def _discard(self, database, unhealthy=False):
+        database.close()
+        with self._condition:
+            self._size -= 1
+            self.metrics["unhealthy"] += unhealthy
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        database = self.acquire(timeout)
+        try:
+            yield database
+        except BaseException:
+            # the error may have left the connection broken, only keep it if it still answers
+            if database.ping():
+                self.release(database)
+            else:
+                self._discard(database, unhealthy=True)
+            raise
+        else:
+            self.release(database)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle = [database for database, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for database in idle:
+            database.close()
+
+    def idle_connections(self):
+        with self._condition:
+            return [database for database, _ in self._idle]
+
+    def stats(self):
+        with self._condition:
+            return dict(self.metrics, size=self._size, idle=len(self._idle), waiters=self._waiters)
+
+
+# Pooled Database (Adheres to the Database Contract)
+# Every query borrows a connection from the pool, so callers keep the plain Database interface.
+class PooledDatabase(Database):
+    def __init__(self, database_factory, min_size=1, max_size=10, idle_timeout=300.0,
+                 health_check=True, checkout_timeout=None):
+        self._database_factory = database_factory
+        self._pool_options = dict(min_size=min_size, max_size=max_size,
+                                  idle_timeout=idle_timeout, health_check=health_check)
+        self.checkout_timeout = checkout_timeout
+        self.pool = None
+
+    @property
+    def paramstyle(self):
+        return getattr(self._database_factory, "paramstyle", Database.paramstyle)
+
+    def connect(self, host, username, password, database_name):
+        self.pool = ConnectionPool(self._database_factory, (host, username, password, database_name),
+                                   **self._pool_options)
+
+    def execute_query(self, query):
+        with self.pool.connection(self.checkout_timeout) as database:
+            return database.execute_query(query)
+
+    def execute_many(self, query, rows, chunk_size=1000):
+        with self.pool.connection(self.checkout_timeout) as database:
+            return database.execute_many(query, rows, chunk_size)
+
+    def cursor(self, query, batch_size=1000):
+        # the connection stays checked out until the cursor is exhausted or closed
+        database = self.pool.acquire(self.checkout_timeout)
+        try:
+            cursor = database.cursor(query, batch_size)
+        except BaseException:
+            self.pool.release(database)
+            raise
+
+        def close():
+            cursor.close()
+            self.pool.release(database)
+        return ResultCursor(cursor.columns, cursor.fetchmany, batch_size, on_close=close)
+
+    def prepare(self, query):
+        # each pooled connection prepares the statement once and keeps it in its own cache
+        def execute(params):
+            with self.pool.connection(self.checkout_timeout) as database:
+                return database.prepare(query).execute(params)
+
+        def execute_many(rows, chunk_size):
+            with self.pool.connection(self.checkout_timeout) as database:
+                return database.prepare(query).execute_many(rows, chunk_size)
+        return PreparedStatement(query, execute, execute_many)
+
+    def statement_stats(self):
+        # aggregated over the connections that are idle in the pool right now
+        stats = {}
+        for database in self.pool.idle_connections():
+            for query, counts in database.statement_stats().items():
+                merged = stats.setdefault(query, {"hits": 0, "misses": 0})
+                merged["hits"] += counts["hits"]
+                merged["misses"] += counts["misses"]
+        for counts in stats.values():
+            counts["hit_rate"] = counts["hits"] / (counts["hits"] + counts["misses"])
+        return stats
+
+    def ping(self):
+        return self.pool is not None
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+
+
+def benchmark_connection_pool(n_queries=2000, n_threads=8):
+    with tempfile.TemporaryDirectory() as directory:
+        _benchmark_connection_pool(os.path.join(directory, "benchmark.db"), n_queries, n_threads)
+
+def _benchmark_connection_pool(database_name, n_queries, n_threads):
+    setup = SQLiteDatabase()
+    setup.connect("localhost", "", "", database_name)
+    setup.execute_query("CREATE TABLE IF NOT EXISTS customers (id INTEGER PRIMARY KEY, name TEXT)")
+    setup.execute_query("INSERT INTO customers (name) VALUES ('Alice'), ('Bob')")
+    setup.close()
+
+    def unpooled_query(_):
+        database = SQLiteDatabase()
+        database.connect("localhost", "", "", database_name)
+        try:
+            return database.execute_query("SELECT * FROM customers")
+        finally:
+            database.close()
+
+    pooled = PooledDatabase(SQLiteDatabase, min_size=n_threads, max_size=n_threads)
+    pooled.connect("localhost", "", "", database_name)
+
+    for name, run in (("Unpooled", unpooled_query), ("Pooled", lambda _: pooled.execute_query("SELECT * FROM customers"))):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(n_threads) as executor:
+            list(executor.map(run, range(n_queries)))
+        print(f"{name:>8}: {n_queries / (time.perf_counter() - start):,.0f} queries/s")
+    print(pooled.pool.stats())
+    pooled.close()
+
+
+def benchmark_bulk_load(n_rows=1_000_000, chunk_size=10_000):
+    with tempfile.TemporaryDirectory() as directory:
+        database = SQLiteDatabase()
+        database.connect("localhost", "", "", os.path.join(directory, "bulk.db"))
+        database.execute_query("CREATE TABLE events (id INTEGER, name TEXT, amount REAL)")
+
+        rows = ((i, f"event-{i % 100}", i * 0.5) for i in range(n_rows))  # never materialized
+        start = time.perf_counter()
+        database.execute_many("INSERT INTO events VALUES (?, ?, ?)", rows, chunk_size)
+        print(f"Loaded {n_rows:,} rows in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        total = 0.0
+        with database.cursor("SELECT id, name, amount FROM events", batch_size=chunk_size) as cursor:
+            for batch in cursor.batches():
+                total += sum(row[2] for row in batch)
+        print(f"Streamed {n_rows:,} rows in {time.perf_counter() - start:.2f}s (sum of amounts: {total:,.1f})")
+        database.close()
+
+
+def benchmark_prepared_statements(n_queries=50_000):
+    database = SQLiteDatabase()
+    database.connect("localhost", "", "", ":memory:")
+    database.execute_query("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)")
+    database.prepare("INSERT INTO customers (id, name) VALUES (?, ?)").execute_many(
+        ((i, f"customer-{i}") for i in range(1000)))
+
+    start = time.perf_counter()
+    for i in range(n_queries):
+        # every distinct SQL text has to be parsed and planned again
+        database.execute_query(f"SELECT name FROM customers WHERE id = {i % 1000}")
+    formatted = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(n_queries):
+        database.prepare("SELECT name FROM customers WHERE id = ?").execute((i % 1000,))
+    prepared = time.perf_counter() - start
+    print(f"Formatted SQL:       {n_queries / formatted:,.0f} queries/s")
+    print(f"Prepared statements: {n_queries / prepared:,.0f} queries/s")
+
+    # a bound parameter can never change the statement itself
+    print(database.prepare("SELECT name FROM customers WHERE name = ?").execute(("x' OR '1'='1",)))
+    for query, stats in database.statement_stats().items():
+        print(f"{stats['hit_rate']:.1%} hit rate: {query}")
+    database.close()
+
+
+# Columnar Batch
+# Holds a result set column by column: integer and float columns are typed
+# arrays (8 bytes per value, no per-cell Python objects), anything else stays a list.
+# A column starts as an empty list and gets its type from the first values added.
+class ColumnarBatch:
+    TYPECODES = {int: "q", float: "d"}
+
+    def __init__(self, columns=None):
+        self.columns = dict(columns or {})
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    @classmethod
+    def from_rows(cls, names, rows):
+        batch = cls({name: [] for name in names})
+        batch.extend(rows)
+        return batch
+
+    def extend(self, rows):
+        if not rows:
+            return
+        for name, values in zip(list(self.columns), zip(*rows)):  # zip(*rows) transposes in C
+            column = self.columns[name]
+            if not len(column):
+                self.columns[name] = self._new_column(values)
+            elif isinstance(column, array):
+                length = len(column)
+                try:
+                    column.extend(values)
+                except (TypeError, OverflowError):
+                    # a value that does not fit the array demotes the column to a list,
+                    # array.extend is not atomic so the values it managed to append go first
+                    del column[length:]
+                    self.columns[name] = column.tolist() + list(values)
+            else:
+                column.extend(values)
+
+    def _new_column(self, values):
+        kinds = set(map(type, values))
+        if kinds == {int, float}:
+            kinds = {float}
+        if len(kinds) == 1:
+            typecode = self.TYPECODES.get(kinds.pop())
+            if typecode is not None:
+                try:
+                    return array(typecode, values)
+                except OverflowError:
+                    pass
+        return list(values)
+
+    def rows(self):
+        return zip(*self.columns.values())
+
+    def sum(self, name):
+        return sum(self.columns[name])
+
+    def mean(self, name):
+        column = self.columns[name]
+        return sum(column) / len(column) if len(column) else 0.0
+
+    def nbytes(self):
+        # payload size of the typed columns, list columns are reported as None
+        return {name: column.itemsize * len(column) if isinstance(column, array) else None
+                for name, column in self.columns.items()}
+
+
+# Columnar Result Adapter (Adapts any Database to return ColumnarBatch results)
+# Rows are pulled through the streaming cursor and appended to the columns one
+# batch at a time, so the row tuples of a batch are the only row objects alive.
+class ColumnarResultAdapter(Database):
+    def __init__(self, database: Database, batch_size=10_000):
+        self._database = database
+        self.batch_size = batch_size
+
+    @property
+    def paramstyle(self):
+        return self._database.paramstyle
+
+    def connect(self, host, username, password, database_name):
+        self._database.connect(host, username, password, database_name)
+
+    def execute_query(self, query):
+        with self._database.cursor(query, self.batch_size) as cursor:
+            result = ColumnarBatch({name: [] for name in cursor.columns})
+            for batch in cursor.batches():
+                result.extend(batch)
+        return result
+
+    def execute_many(self, query, rows, chunk_size=1000):
+        return self._database.execute_many(query, rows, chunk_size)
+
+    def cursor(self, query, batch_size=1000):
+        return self._database.cursor(query, batch_size)
+
+    def prepare(self, query):
+        return self._database.prepare(query)
+
+    def ping(self):
+        return self._database.ping()
+
+    def close(self):
+        self._database.close()
+
+
+def benchmark_columnar_results(n_rows=300_000):
+    import tracemalloc
+
+    database = SQLiteDatabase()
+    database.connect("localhost", "", "", ":memory:")
+    database.execute_query("CREATE TABLE sales (id INTEGER, region TEXT, amount REAL)")
+    database.execute_many("INSERT INTO sales VALUES (?, ?, ?)",
+                          ((i, f"region-{i % 8}", i * 0.25) for i in range(n_rows)), 10_000)
+    query = "SELECT id, region, amount FROM sales"
+
+    tracemalloc.start()
+    with database.cursor(query) as cursor:
+        names = cursor.columns
+        dict_rows = [dict(zip(names, row)) for row in cursor]
+    dict_total = sum(row["amount"] for row in dict_rows)
+    dict_memory = tracemalloc.get_traced_memory()[0]
+    del dict_rows
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    columnar = ColumnarResultAdapter(database).execute_query(query)
+    columnar_total = columnar.sum("amount")
+    columnar_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"List of dicts: {dict_memory / 2**20:.1f} MB (sum {dict_total:,.1f})")
+    print(f"Columnar:      {columnar_memory / 2**20:.1f} MB (sum {columnar_total:,.1f})")
+    database.close()
+
+
+# Async Database Contract (Abstract Class)
+# Same contract as Database, but every round trip is awaited, so a single
+# event loop can keep many queries in flight at once.
+class AsyncDatabase(ABC):
+    paramstyle = "qmark"  # see Database.paramstyle
+
+    @abstractmethod
+    async def connect(self, host, username, password, database_name):
+        pass
+
+    @abstractmethod
+    async def execute_query(self, query):
+        pass
+
+    @abstractmethod
+    async def execute_many(self, query, rows, chunk_size=1000):
+        pass
+
+    @abstractmethod
+    async def cursor(self, query, batch_size=1000):
+        # returns an AsyncResultCursor
+        pass
+
+    async def close(self):
+        pass
+
+    async def pipeline(self, queries, max_in_flight=16):
+        # sends the queries concurrently (at most max_in_flight at a time), results keep the input order
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def run(query):
+            async with semaphore:
+                return await self.execute_query(query)
+        return await asyncio.gather(*(run(query) for query in queries))
+
+
+# Async Result Cursor
+class AsyncResultCursor:
+    def __init__(self, columns, fetch_batch, batch_size=1000, on_close=None):
+        self.columns = columns
+        self.batch_size = batch_size
+        self._fetch_batch = fetch_batch  # coroutine function: batch_size -> list of rows
+        self._on_close = on_close        # coroutine function
+        self.closed = False
+
+    async def fetchmany(self, size=None):
+        if self.closed:
+            return []
+        batch = await self._fetch_batch(size or self.batch_size)
+        if not batch:
+            await self.close()
+        return batch
+
+    async def batches(self):
+        try:
+            while True:
+                batch = await self.fetchmany()
+                if not batch:
+                    return
+                yield batch
+        finally:
+            await self.close()
+
+    async def __aiter__(self):
+        async for batch in self.batches():
+            for row in batch:
+                yield row
+
+    async def close(self):
+        if not self.closed:
+            self.closed = True
+            if self._on_close is not None:
+                await self._on_close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+# Async PostgreSQL Database (Adheres to the AsyncDatabase Contract)
+# latency simulates the network round trip of a native async driver.
+class AsyncPostgreSQLDatabase(AsyncDatabase):
+    paramstyle = "dollar"
+
+    def __init__(self, latency=0.01, verbose=True):
+        self.latency = latency
+        self.verbose = verbose
+
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    async def connect(self, host, username, password, database_name):
+        await asyncio.sleep(self.latency)
+        self._log(f"Connected to PostgreSQL database on {host} as {username} (async)")
+
+    async def execute_query(self, query):
+        await asyncio.sleep(self.latency)
+        self._log(f"Executing PostgreSQL Query: {query}")
+        return []
+
+    async def execute_many(self, query, rows, chunk_size=1000):
+        total = 0
+        for chunk in chunked(rows, chunk_size):
+            await asyncio.sleep(self.latency)
+            self._log(f"Executing PostgreSQL batch of {len(chunk)} rows: {query}")
+            total += len(chunk)
+        return total
+
+    async def cursor(self, query, batch_size=1000):
+        await asyncio.sleep(self.latency)
+        self._log(f"DECLARE result_cursor CURSOR FOR {query}")
+
+        async def fetch(size):
+            await asyncio.sleep(self.latency)
+            return []
+        return AsyncResultCursor([], fetch, batch_size)
+
+
+# Async MySQL Adapter (Implements the AsyncDatabase Contract)
+class AsyncMySQLAdapter(AsyncDatabase):
+    def __init__(self, database: AsyncDatabase, translation_cache_size=256):
+        self._database = database
+        self._translator = MySQLToPostgreSQLTranslator(database.paramstyle)
+        self.translation_cache = LRUCache(translation_cache_size)
+
+    # same cached MySQL -> PostgreSQL translation
+    translate = MySQLAdapter.translate
+    translate_statement = MySQLAdapter.translate_statement
+    _reorder = MySQLAdapter._reorder
+
+    async def connect(self, host, username, password, database_name):
+        await self._database.connect(host, username, password, database_name)
+
+    async def execute_query(self, query):
+        return await self._database.execute_query(self.translate(query))
+
+    async def execute_many(self, query, rows, chunk_size=1000):
+        translated, order = self.translate_statement(query)
+        if order is not None:
+            rows = (self._reorder(order, params) for params in rows)
+        return await self._database.execute_many(translated, rows, chunk_size)
+
+    async def cursor(self, query, batch_size=1000):
+        return await self._database.cursor(self.translate(query), batch_size)
+
+    async def pipeline(self, queries, max_in_flight=16):
+        return await self._database.pipeline([self.translate(query) for query in queries], max_in_flight)
+
+    async def close(self):
+        await self._database.close()
+
+
+# Async Connection Pool
+# The asyncio counterpart of ConnectionPool for native async drivers.
+class AsyncConnectionPool:
+    def __init__(self, database_factory, connect_args, min_size=1, max_size=10):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self._database_factory = database_factory
+        self._connect_args = connect_args
+        self.min_size = min_size
+        self.max_size = max_size
+        self._idle = asyncio.LifoQueue()
+        self._size = 0
+        self.metrics = {"created": 0, "checkouts": 0, "waits": 0, "timeouts": 0}
+
+    async def open(self):
+        for _ in range(self.min_size):
+            self._size += 1
+            self._idle.put_nowait(await self._create())
+        return self
+
+    async def _create(self):
+        try:
+            database = self._database_factory()
+            await database.connect(*self._connect_args)
+        except BaseException:
+            self._size -= 1
+            raise
+        self.metrics["created"] += 1
+        return database
+
+    async def acquire(self, timeout=None):
+        self.metrics["checkouts"] += 1
+        if self._idle.empty() and self._size < self.max_size:
+            self._size += 1
+            return await self._create()
+        if self._idle.empty():
+            self.metrics["waits"] += 1
+        try:
+            return await asyncio.wait_for(self._idle.get(), timeout)
+        except asyncio.TimeoutError:
+            self.metrics["timeouts"] += 1
+            raise PoolTimeoutError(f"No connection available within the timeout (max_size={self.max_size})") from None
+
+    def release(self, database):
+        self._idle.put_nowait(database)
+
+    def connection(self, timeout=None):
+        return _AsyncPoolConnection(self, timeout)
+
+    async def close(self):
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+            self._size -= 1
+
+class _AsyncPoolConnection:
+    def __init__(self, pool, timeout):
+        self._pool = pool
+        self._timeout = timeout
+        self._database = None
+
+    async def __aenter__(self):
+        self._database = await self._pool.acquire(self._timeout)
+        return self._database
+
+    async def __aexit__(self, *exc_info):
+        # also runs on cancellation, so a cancelled query never leaks its connection
+        self._pool.release(self._database)
+
+
+# Async Pooled Database (Adheres to the AsyncDatabase Contract)
+class AsyncPooledDatabase(AsyncDatabase):
+    def __init__(self, database_factory, min_size=1, max_size=10, checkout_timeout=None):
+        self._database_factory = database_factory
+        self._pool_options = dict(min_size=min_size, max_size=max_size)
+        self.checkout_timeout = checkout_timeout
+        self.pool = None
+
+    @property
+    def paramstyle(self):
+        return getattr(self._database_factory, "paramstyle", AsyncDatabase.paramstyle)
+
+    async def connect(self, host, username, password, database_name):
+        self.pool = await AsyncConnectionPool(self._database_factory, (host, username, password, database_name),
+                                              **self._pool_options).open()
+
+    async def execute_query(self, query):
+        async with self.pool.connection(self.checkout_timeout) as database:
+            return await database.execute_query(query)
+
+    async def execute_many(self, query, rows, chunk_size=1000):
+        async with self.pool.connection(self.checkout_timeout) as database:
+            return await database.execute_many(query, rows, chunk_size)
+
+    async def cursor(self, query, batch_size=1000):
+        database = await self.pool.acquire(self.checkout_timeout)
+        try:
+            cursor = await database.cursor(query, batch_size)
+        except BaseException:
+            self.pool.release(database)
+            raise
+
+        async def close():
+            await cursor.close()
+            self.pool.release(database)
+        return AsyncResultCursor(cursor.columns, cursor.fetchmany, batch_size, on_close=close)
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+
+
+# Executor Database (Adapts a blocking Database to the AsyncDatabase Contract)
+# Blocking drivers such as sqlite3 run on a bounded thread pool. Connections are
+# reserved on the event loop before any work reaches a worker thread: queries use
+# one of max_workers slots, open cursors one of max_cursors slots, and the pool
+# holds one connection per slot, so a worker thread never waits for a connection
+# (an open cursor cannot starve the threads its own fetches need). Cancelling the
+# awaiting task interrupts the statement if the driver supports it.
+class ExecutorDatabase(AsyncDatabase):
+    def __init__(self, database_factory, max_workers=4, max_cursors=None, checkout_timeout=None):
+        self._database_factory = database_factory
+        self.max_workers = max_workers
+        self.max_cursors = max_workers if max_cursors is None else max_cursors
+        self.checkout_timeout = checkout_timeout
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="db")
+        self._query_slots = asyncio.Semaphore(max_workers)
+        self._cursor_slots = asyncio.Semaphore(self.max_cursors)
+        self.pool = None
+
+    @property
+    def paramstyle(self):
+        return getattr(self._database_factory, "paramstyle", Database.paramstyle)
+
+    async def _run(self, operation, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, operation, *args)
+
+    async def _reserve(self, slots):
+        try:
+            await asyncio.wait_for(slots.acquire(), self.checkout_timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError(f"No connection available within the timeout (max_size={self.pool.max_size})") from None
+
+    async def connect(self, host, username, password, database_name):
+        self.pool = await self._run(ConnectionPool, self._database_factory,
+                                    (host, username, password, database_name), 1,
+                                    self.max_workers + self.max_cursors)
+
+    async def _with_connection(self, operation):
+        await self._reserve(self._query_slots)
+        in_use = []
+
+        def work():
+            with self.pool.connection() as database:
+                in_use.append(database)
+                return operation(database)
+        try:
+            return await self._run(work)
+        except asyncio.CancelledError:
+            if in_use and hasattr(in_use[0], "interrupt"):
+                in_use[0].interrupt()
+            raise
+        finally:
+            self._query_slots.release()
+
+    async def execute_query(self, query):
+        return await self._with_connection(lambda database: database.execute_query(query))
+
+    async def execute_many(self, query, rows, chunk_size=1000):
+        return await self._with_connection(lambda database: database.execute_many(query, rows, chunk_size))
+
+    async def cursor(self, query, batch_size=1000):
+        # the connection stays checked out until the cursor is closed, on a slot of its own
+        await self._reserve(self._cursor_slots)
+
+        def open_cursor():
+            database = self.pool.acquire()
+            try:
+                return database, database.cursor(query, batch_size)
+            except BaseException:
+                self.pool.release(database)
+                raise
+
+        # checkout and open are one job, shielded: if the awaiting task is cancelled the job
+        # still finishes, and its connection and slot are given back when it does
+        job = asyncio.get_running_loop().run_in_executor(self._executor, open_cursor)
+
+        def give_back(job):
+            if not job.cancelled() and job.exception() is None:
+                database, cursor = job.result()
+                cursor.close()
+                self.pool.release(database)
+            self._cursor_slots.release()
+        try:
+            database, cursor = await asyncio.shield(job)
+        except asyncio.CancelledError:
+            job.add_done_callback(give_back)
+            raise
+        except BaseException:
+            self._cursor_slots.release()
+            raise
+
+        async def fetch(size):
+            return await self._run(cursor.fetchmany, size)
+
+        async def close():
+            try:
+                await self._run(cursor.close)
+            finally:
+                self.pool.release(database)
+                self._cursor_slots.release()
+        return AsyncResultCursor(cursor.columns, fetch, batch_size, on_close=close)
+
+    async def close(self):
+        if self.pool is not None:
+            await self._run(self.pool.close)
+        self._executor.shutdown(wait=False)
+
+
+def benchmark_async_queries(n_queries=200, latency=0.01):
+    async def run():
+        database = AsyncPooledDatabase(lambda: AsyncPostgreSQLDatabase(latency, verbose=False), max_size=32)
+        await database.connect("localhost", "user123", "password123", "mydb")
+        queries = [f"SELECT * FROM customers WHERE id = {i}" for i in range(n_queries)]
+
+        start = time.perf_counter()
+        for query in queries:
+            await database.execute_query(query)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await database.pipeline(queries, max_in_flight=32)
+        pipelined = time.perf_counter() - start
+        print(f"Sequential: {n_queries / sequential:,.0f} queries/s")
+        print(f"Pipelined:  {n_queries / pipelined:,.0f} queries/s ({database.pool.metrics['created']} connections)")
+        await database.close()
+
+        # a long running SQLite query is interrupted when its task is cancelled
+        sqlite = ExecutorDatabase(SQLiteDatabase, max_workers=2)
+        await sqlite.connect("localhost", "", "", ":memory:")
+        slow = asyncio.ensure_future(sqlite.execute_query(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n"))
+        await asyncio.sleep(0.1)
+        slow.cancel()
+        try:
+            await slow
+        except asyncio.CancelledError:
+            print("Slow SQLite query cancelled")
+        print(await sqlite.execute_query("SELECT 1"))
+        await sqlite.close()
+    asyncio.run(run())
 
 
 class IView(ABC):
@@ -75,13 +1413,92 @@ class View(IView):
     def render(self,data):
         print(f"handle only json data {data}")
 
+# XML Adapter View
+# Parses the XML incrementally and hands every record (by default, every child
+# of the document root) to the wrapped JSON view as soon as it is complete.
+# Finished records are detached from the tree, so memory is bounded by the
+# size of one record rather than by the size of the document.
 class XMLAdapterView(IView):
-    def __init__(self,view):
+    def __init__(self, view, record_tag=None, record_depth=1):
         self._view = view
+        self.record_tag = record_tag
+        self.record_depth = record_depth
 
-    def render(self,data):
-        print("convert xml data to json")
-        self._view.render(data)
+    def render(self, data):
+        for record in self.iter_records(data):
+            self._view.render(json.dumps(record))
+
+    def iter_records(self, data):
+        stack = []
+        for event, element in ElementTree.iterparse(self._open(data), events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            if self._is_record(element, len(stack)):
+                yield {element.tag: self._to_dict(element)}
+                if stack:
+                    stack[-1].remove(element)
+                element.clear()
+
+    def _is_record(self, element, depth):
+        if self.record_tag is not None:
+            return element.tag == self.record_tag
+        return depth == self.record_depth
+
+    @staticmethod
+    def _open(data):
+        if isinstance(data, bytes):
+            return io.BytesIO(data)
+        if isinstance(data, str) and data.lstrip().startswith("<"):
+            return io.BytesIO(data.encode("utf-8"))
+        return data  # a path or a binary file object
+
+    @classmethod
+    def _to_dict(cls, element):
+        result = {f"@{name}": value for name, value in element.attrib.items()}
+        for child in element:
+            value = cls._to_dict(child)
+            if child.tag not in result:
+                result[child.tag] = value
+            elif isinstance(result[child.tag], list):
+                result[child.tag].append(value)
+            else:
+                result[child.tag] = [result[child.tag], value]
+        text = (element.text or "").strip()
+        if not result:
+            return text or None
+        if text:
+            result["#text"] = text
+        return result
+
+
+def benchmark_xml_feed(n_records=200_000):
+    class CountingView(IView):
+        def __init__(self):
+            self.records = 0
+            self.bytes = 0
+
+        def render(self, data):
+            self.records += 1
+            self.bytes += len(data)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "feed.xml")
+        with open(path, "w", encoding="utf-8") as feed:
+            feed.write("<products>\n")
+            for i in range(n_records):
+                feed.write(f'<product id="{i}"><name>Product {i}</name><price currency="USD">{i % 500}.99</price>'
+                           f'<tag>sale</tag><tag>new</tag></product>\n')
+            feed.write("</products>\n")
+        size = os.path.getsize(path)
+
+        view = CountingView()
+        start = time.perf_counter()
+        XMLAdapterView(view).render(path)
+        elapsed = time.perf_counter() - start
+        print(f"Converted {view.records:,} records ({size / 2**20:.1f} MB) in {elapsed:.2f}s "
+              f"({size / 2**20 / elapsed:.1f} MB/s)")
         
         
 
@@ -101,10 +1518,40 @@ if __name__ == "__main__":
 
     query = "SELECT * FROM customers LIMIT 10"
     adapter.execute_query(query)
+
+    # identifiers and string literals survive the translation untouched
+    adapter.execute_query("SELECT `name` FROM customers WHERE note = \"LIMIT 5, 10\" LIMIT 20, 10")
+    adapter.execute_query(query)  # served from the translation cache
+    print(adapter.translation_cache.stats())
+    print("=====================================================")
+    print(" Start of Connection Pool Example")
+    benchmark_connection_pool()
+    print("=====================================================")
+    print(" Start of Bulk Load Example")
+    adapter.execute_many("INSERT INTO `customers` (`name`) VALUES (?)", [("Alice",), ("Bob",)])
+    benchmark_bulk_load()
+    print("=====================================================")
+    print(" Start of Prepared Statement Example")
+    statement = adapter.prepare("SELECT * FROM `customers` WHERE `name` = ? LIMIT ?, ?")
+    statement.execute(("Alice", 20, 10))
+    adapter.prepare("SELECT * FROM `customers` WHERE `name` = ? LIMIT ?, ?").execute(("Bob", 0, 10))
+    print(adapter.statement_stats())
+    benchmark_prepared_statements()
+    print("=====================================================")
+    print(" Start of Columnar Result Example")
+    benchmark_columnar_results()
+    print("=====================================================")
+    print(" Start of Async Database Example")
+    async_adapter = AsyncMySQLAdapter(AsyncPostgreSQLDatabase())
+    asyncio.run(async_adapter.connect(host, username, password, database_name))
+    asyncio.run(async_adapter.pipeline(["SELECT * FROM `customers` LIMIT 20, 10", "SELECT `name` FROM `orders`"]))
+    benchmark_async_queries()
     print("=====================================================")
     print(" Start of Data Parser Adapter Example")
     
     view = View()
     view.render("json data")
     xml_adapter_view = XMLAdapterView(view)
-    xml_adapter_view.render("xml data")
+    xml_adapter_view.render('<customers><customer id="1"><name>Alice</name></customer>'
+                            '<customer id="2"><name>Bob</name><tag>vip</tag><tag>new</tag></customer></customers>')
+    benchmark_xml_feed()
@@ -26,11 +26,30 @@ Client Code:
 
 # Bridge Pattern Example: View-Resources
 
+import functools
+import io
+import itertools
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from string import Formatter
 
 # Implementor Interface: Resource
 
 class Resource(ABC):
+    __slots__ = ()  # lets slotted implementors such as CatalogResource skip the instance __dict__
+    FIELDS = ("snippet", "title", "image", "url")
+    version = 0  # bumped whenever the fields of the resource change
+
+    def bump_version(self):
+        self.version += 1
+
     @abstractmethod
     def get_snippet(self):
         pass
@@ -47,6 +66,24 @@ class Resource(ABC):
     def get_url(self):
         pass
 
+    def get_fields(self, names=FIELDS):
+        # Bulk accessor used by the views, override it when the fields come from one lookup
+        return {name: getattr(self, f"get_{name}")() for name in names}
+
+    @staticmethod
+    def prefetch(resources):
+        # Groups the resources by type and lets each implementor load its own in bulk
+        by_type = {}
+        for resource in resources:
+            by_type.setdefault(type(resource), []).append(resource)
+        for resource_type, group in by_type.items():
+            resource_type.prefetch_many(group)
+
+    @classmethod
+    def prefetch_many(cls, resources):
+        # Hook for implementors whose fields come from a slow lookup, nothing to do by default
+        pass
+
 
 # Concrete Implementors: Albums, Artists, and Songs
 class Albums(Resource):
@@ -88,41 +125,357 @@ class Songs(Resource):
     def get_url(self):
         return "Song URL"
 
+
+# Resource Store: where the fields of stored resources actually live (database, API, ...)
+class ResourceStore(ABC):
+    @abstractmethod
+    def fetch_many(self, resource_ids):
+        # returns {resource_id: {field: value}} for all ids in a single round trip
+        pass
+
+class InMemoryResourceStore(ResourceStore):
+    def __init__(self, records):
+        self._records = records
+        self.fetches = 0
+
+    def fetch_many(self, resource_ids):
+        self.fetches += 1
+        return {resource_id: dict(self._records[resource_id]) for resource_id in resource_ids}
+
+# Concrete Implementor: StoredResource
+# Fields are fetched from the store in one lookup and kept in a per-resource cache,
+# get_many builds a whole page of resources with a single batched fetch.
+class StoredResource(Resource):
+    def __init__(self, store: ResourceStore, resource_id):
+        self.store = store
+        self.resource_id = resource_id
+        self._fields = None
+
+    @classmethod
+    def get_many(cls, store: ResourceStore, resource_ids):
+        resources = [cls(store, resource_id) for resource_id in resource_ids]
+        cls.load_many(store, resources)
+        return resources
+
+    @staticmethod
+    def load_many(store: ResourceStore, resources):
+        records = store.fetch_many([resource.resource_id for resource in resources])
+        for resource in resources:
+            resource._fields = records[resource.resource_id]
+
+    @classmethod
+    def prefetch_many(cls, resources):
+        # one batched fetch per store for the resources that are not loaded yet
+        by_store = {}
+        for resource in resources:
+            if not resource.is_loaded():
+                by_store.setdefault(resource.store, []).append(resource)
+        for store, pending in by_store.items():
+            cls.load_many(store, pending)
+
+    def is_loaded(self):
+        return self._fields is not None
+
+    def invalidate(self):
+        self._fields = None
+        self.bump_version()
+
+    def set_field(self, name, value):
+        if self._fields is None:
+            self.load_many(self.store, [self])
+        self._fields[name] = value
+        self.bump_version()
+
+    def get_fields(self, names=Resource.FIELDS):
+        if self._fields is None:
+            self.load_many(self.store, [self])
+        return {name: self._fields[name] for name in names}
+
+    def get_snippet(self):
+        return self.get_fields(("snippet",))["snippet"]
+
+    def get_title(self):
+        return self.get_fields(("title",))["title"]
+
+    def get_image(self):
+        return self.get_fields(("image",))["image"]
+
+    def get_url(self):
+        return self.get_fields(("url",))["url"]
+
+# View Template: parsed once when the view class is created and compiled into an
+# f-string function, so rendering only looks up the fields and joins the pieces.
+# Templates with nested specs or attribute/index lookups fall back to str.format_map.
+class ViewTemplate:
+    def __init__(self, source):
+        self.source = source
+        parts = list(Formatter().parse(source))
+        self.fields = tuple(dict.fromkeys(name for _, name, _, _ in parts if name))
+        self.render = self._compile(parts) or source.format_map
+
+    @staticmethod
+    def _compile(parts):
+        pieces = []
+        for literal, name, format_spec, conversion in parts:
+            pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+            if name is None:
+                continue
+            if not name.isidentifier() or "{" in (format_spec or "") or (conversion or "r") not in "rsa":
+                return None
+            conversion = f"!{conversion}" if conversion else ""
+            format_spec = f":{format_spec}" if format_spec else ""
+            pieces.append(f"{{fields[{name!r}]{conversion}{format_spec}}}")
+        try:
+            return eval(f"lambda fields: f{''.join(pieces)!r}")
+        except SyntaxError:  # e.g. quotes in a format spec next to the quoted field names
+            return None
+
+
+# Memory-Mapped Catalog
+# File layout (little endian):
+#   header:  magic "CATL", record count (uint64), index offset (uint64)
+#   records: per record, len(FIELDS) + 1 uint32 field boundaries relative to the record start,
+#            followed by the UTF-8 bytes of the fields
+#   index:   one uint64 absolute offset per record
+# Opening the catalog only reads the header, every field is decoded on first access,
+# and because the file is mapped read-only, renderer processes share the page cache.
+class MappedCatalog:
+    MAGIC = b"CATL"
+    HEADER = struct.Struct("<4sQQ")
+    OFFSET = struct.Struct("<Q")
+    BOUNDS = struct.Struct(f"<{len(Resource.FIELDS) + 1}I")
+
+    def __init__(self, path):
+        with open(path, "rb") as catalog_file:
+            self._map = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._index_offset = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a resource catalog")
+
+    @classmethod
+    def write(cls, path, records):
+        # records is any iterable of {field: str} dicts, only the offsets are kept in memory
+        offsets = array("Q")
+        with open(path, "wb") as catalog_file:
+            catalog_file.write(b"\0" * cls.HEADER.size)
+            position = cls.HEADER.size
+            for record in records:
+                encoded = [record[name].encode("utf-8") for name in Resource.FIELDS]
+                bounds = [cls.BOUNDS.size]
+                for value in encoded:
+                    bounds.append(bounds[-1] + len(value))
+                offsets.append(position)
+                catalog_file.write(cls.BOUNDS.pack(*bounds))
+                catalog_file.writelines(encoded)
+                position += bounds[-1]
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            catalog_file.write(offsets.tobytes())
+            catalog_file.seek(0)
+            catalog_file.write(cls.HEADER.pack(cls.MAGIC, len(offsets), position))
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, record_index):
+        if not 0 <= record_index < self._count:
+            raise IndexError(record_index)
+        return CatalogResource(self, record_index)
+
+    def read_field(self, record_index, field_index):
+        start = self.OFFSET.unpack_from(self._map, self._index_offset + record_index * self.OFFSET.size)[0]
+        bounds = self.BOUNDS.unpack_from(self._map, start)
+        return self._map[start + bounds[field_index]:start + bounds[field_index + 1]].decode("utf-8")
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Concrete Implementor: CatalogResource
+# A lightweight, read-only handle (catalog, record index), fields are read from the mapping on demand.
+class CatalogResource(Resource):
+    __slots__ = ("catalog", "record_index")
+    _FIELD_INDEX = {name: index for index, name in enumerate(Resource.FIELDS)}
+
+    def __init__(self, catalog: MappedCatalog, record_index):
+        self.catalog = catalog
+        self.record_index = record_index
+
+    def __eq__(self, other):
+        return (isinstance(other, CatalogResource)
+                and self.catalog is other.catalog and self.record_index == other.record_index)
+
+    def __hash__(self):
+        return hash((id(self.catalog), self.record_index))
+
+    def get_fields(self, names=Resource.FIELDS):
+        return {name: self.catalog.read_field(self.record_index, self._FIELD_INDEX[name]) for name in names}
+
+    def get_snippet(self):
+        return self.catalog.read_field(self.record_index, 0)
+
+    def get_title(self):
+        return self.catalog.read_field(self.record_index, 1)
+
+    def get_image(self):
+        return self.catalog.read_field(self.record_index, 2)
+
+    def get_url(self):
+        return self.catalog.read_field(self.record_index, 3)
+
+
+def benchmark_mapped_catalog(n_records=1_000_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.bin")
+        start = time.perf_counter()
+        MappedCatalog.write(path, ({"snippet": f"Album {i} snippet", "title": f"Album {i}",
+                                    "image": f"album-{i}.png", "url": f"/albums/{i}"} for i in range(n_records)))
+        print(f"Wrote {n_records:,} records ({os.path.getsize(path) / 2**20:.1f} MB) "
+              f"in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        with MappedCatalog(path) as catalog:
+            opened = time.perf_counter() - start
+            print(ShortFormView(catalog[n_records - 1]).show())
+            start = time.perf_counter()
+            titles = [catalog[i].get_title() for i in range(0, n_records, 10)]
+            elapsed = time.perf_counter() - start
+        print(f"Opened in {opened * 1000:.2f} ms, read {len(titles):,} titles in {elapsed:.2f}s")
+
+
+# Render Cache: LRU of rendered output keyed by (view class, resource),
+# an entry is only served while the resource still has the version it was rendered at.
+class RenderCache:
+    def __init__(self, max_size=10_000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, view_class, resource, render):
+        key = (view_class, resource)
+        version = resource.version
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        output = render()
+        self._entries[key] = (version, output)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return output
+
+    def clear(self):
+        self._entries.clear()
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+def cached_show(show):
+    @functools.wraps(show)
+    def wrapper(self):
+        cache = type(self).render_cache
+        # a show() calling super().show() re-enters with the same key, only the outer call is cached
+        if cache is None or self.__dict__.get("_rendering"):
+            return show(self)
+        self._rendering = True
+        try:
+            return cache.get_or_render(type(self), self.resource, lambda: show(self))
+        finally:
+            self._rendering = False
+    return wrapper
+
+
 # Abstraction Interface: View
 
 class View(ABC):
+    template = None  # layout of the view, compiled into a ViewTemplate per class
+    render_cache = RenderCache()  # shared by all views, set to None to disable
+
     def __init__(self, resource):
         self.resource : Resource = resource
-    @abstractmethod
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if isinstance(cls.template, str):
+            cls.template = ViewTemplate(cls.template)
+        # True when some class between View and cls renders with its own show() instead of the template
+        cls._custom_show = any("show" in klass.__dict__ for klass in cls.__mro__[:cls.__mro__.index(View)])
+        if cls.template is None and not cls._custom_show:
+            raise TypeError(f"{cls.__name__} needs a template or its own show()")
+        if "show" in cls.__dict__:
+            # subclasses with their own show() are cached the same way
+            cls.show = cached_show(cls.__dict__["show"])
+
+    @cached_show
     def show(self):
-        pass
+        return self.template.render(self.resource.get_fields(self.template.fields))
+
+    @classmethod
+    def show_many(cls, resources):
+        # one batched fetch for the whole page instead of one lookup per resource
+        resources = list(resources)
+        Resource.prefetch(resources)
+        return [cls(resource).show() for resource in resources]
+
+    @classmethod
+    def render_many(cls, resources, out, page_size=1000, separator="\n"):
+        # streams any number of resources into a file-like object, one page of fields in memory at a time,
+        # this bypasses the render cache on purpose: a one-off pass over millions of resources would only evict it
+        template, write = cls.template, out.write
+        if cls._custom_show:
+            # views with their own show() are rendered through it, one view per resource
+            render = lambda resource: cls(resource).show()
+        else:
+            render = lambda resource: template.render(resource.get_fields(template.fields))
+        resources = iter(resources)
+        count = 0
+        while True:
+            page = list(itertools.islice(resources, page_size))
+            if not page:
+                return count
+            Resource.prefetch(page)
+            for resource in page:
+                write(render(resource))
+                write(separator)
+            count += len(page)
 
 # Refined Abstraction: LongFormView
 class LongFormView(View):
-    def show(self):
-        snippet = self.resource.get_snippet()
-        title = self.resource.get_title()
-        image = self.resource.get_image()
-        url = self.resource.get_url()
-        return f"Long Form View:\nTitle: {title}\nSnippet: {snippet}\nImage: {image}\nURL: {url}"
+    template = "Long Form View:\nTitle: {title}\nSnippet: {snippet}\nImage: {image}\nURL: {url}"
 
 # Refined Abstraction: PopupView
 class PopupView(View):
-    def show(self):
-        snippet = self.resource.get_snippet()
-        title = self.resource.get_title()
-        image = self.resource.get_image()
-        url = self.resource.get_url()
-        return f"Popup View:\nTitle: {title}\nSnippet: {snippet}\nImage: {image}\nURL: {url}"
+    template = "Popup View:\nTitle: {title}\nSnippet: {snippet}\nImage: {image}\nURL: {url}"
 
 # Refined Abstraction: ShortFormView
 class ShortFormView(View):
-    def show(self):
-        snippet = self.resource.get_snippet()
-        title = self.resource.get_title()
-        image = self.resource.get_image()
-        url = self.resource.get_url()
-        return f"Short Form View:\nTitle: {title}\nSnippet: {snippet}\nImage: {image}\nURL: {url}"
+    template = "Short Form View:\nTitle: {title}\nSnippet: {snippet}\nImage: {image}\nURL: {url}"
+
+
+def benchmark_render_many(n_resources=500_000):
+    store = InMemoryResourceStore({
+        resource_id: {"snippet": f"Song {resource_id} snippet", "title": f"Song {resource_id}",
+                      "image": f"song-{resource_id}.png", "url": f"/songs/{resource_id}"}
+        for resource_id in range(n_resources)
+    })
+    resources = (StoredResource(store, resource_id) for resource_id in range(n_resources))
+    out = io.StringIO()
+    start = time.perf_counter()
+    count = ShortFormView.render_many(resources, out)
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {count:,} resources ({out.tell() / 2**20:.1f} MB) in {elapsed:.2f}s "
+          f"with {store.fetches} fetches")
 
 # Client Code
 if __name__ == "__main__":
@@ -137,3 +490,23 @@ if __name__ == "__main__":
     print(long_albums_view.show())
     print(popup_artists_view.show())
     print(short_songs_view.show())
+
+    store = InMemoryResourceStore({
+        resource_id: {"snippet": f"Song {resource_id} snippet", "title": f"Song {resource_id}",
+                      "image": f"song-{resource_id}.png", "url": f"/songs/{resource_id}"}
+        for resource_id in range(100)
+    })
+    page = LongFormView.show_many(StoredResource(store, resource_id) for resource_id in range(100))
+    print(page[-1])
+    print(f"Rendered {len(page)} resources with {store.fetches} fetch")
+
+    song = StoredResource(store, 7)
+    print(PopupView(song).show())
+    PopupView(song).show()  # served from the render cache
+    song.set_field("title", "Song 7 (Remastered)")  # bumps the version
+    print(PopupView(song).show())
+    cache = View.render_cache
+    print(f"Render cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate():.1%} hit rate)")
+
+    benchmark_render_many()
+    benchmark_mapped_catalog()
@@ -22,6 +22,73 @@ in your software systems without modifying their code, making your code more mai
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+# Version counter shared by components and decorators.
+# A component bumps its own counter whenever its state changes,
+# a decorator reports its own counter plus the counter of the object it wraps.
+# Counters only ever grow, so any change inside the chain changes the outer version.
+class Versioned:
+    _version = 0
+
+    @property
+    def version(self):
+        return self._version
+
+    def bump_version(self):
+        self._version += 1
+
+
+# Generic Memoizing Decorator
+# Caches the results of the wrapped component and serves them until the
+# component's version changes. The cache is an LRU bounded by max_size.
+class MemoizingDecorator(Versioned):
+    def __init__(self, component, max_size=128):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._component = component
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self):
+        return self._version + self._component.version
+
+    def _memoized(self, method_name, *args):
+        key = (method_name, args)
+        version = self._component.version
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == version:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = getattr(self._component, method_name)(*args)
+        self._cache[key] = (version, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        self._cache.clear()
+        self.bump_version()
+
+    def cache_info(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._cache),
+            "max_size": self._max_size,
+        }
+
+
 # Example 1: Coffee Shop
 
 class ICoffee(ABC):
@@ -30,15 +97,26 @@ class ICoffee(ABC):
         pass
 
 # Component: Coffee
-class Coffee(ICoffee):
+class Coffee(Versioned, ICoffee):
+    def __init__(self, price=5):
+        self._price = price
+
+    def set_price(self, price):
+        self._price = price
+        self.bump_version()
+
     def cost(self):
-        return 5
+        return self._price
 
 # Decorator: CoffeeDecorator
-class CoffeeDecorator(ICoffee):
+class CoffeeDecorator(Versioned, ICoffee):
     def __init__(self, coffee):
         self._coffee = coffee
 
+    @property
+    def version(self):
+        return self._version + self._coffee.version
+
     def cost(self):
         return self._coffee.cost()
 
@@ -57,6 +135,11 @@ class Sugar(CoffeeDecorator):
     def cost(self):
         return self._coffee.cost() + 1
 
+# Memoizing Decorator: caches the cost of the whole chain below it
+class MemoizedCoffee(MemoizingDecorator, ICoffee):
+    def cost(self):
+        return self._memoized("cost")
+
 
 # Example 2: Text Editor
 
@@ -66,15 +149,26 @@ class IText(ABC):
         pass
 
 # Component: Text
-class Text(IText):
+class Text(Versioned, IText):
+    def __init__(self, text="This is some text."):
+        self._content = text
+
+    def set_content(self, text):
+        self._content = text
+        self.bump_version()
+
     def content(self):
-        return "This is some text."
+        return self._content
 
 # Decorator: TextDecorator
-class TextDecorator(IText):
+class TextDecorator(Versioned, IText):
     def __init__(self, text):
         self._text = text
 
+    @property
+    def version(self):
+        return self._version + self._text.version
+
     def content(self):
         return self._text.content()
 
@@ -84,6 +178,10 @@ class SpellCheck(TextDecorator):
         text = self._text.content()
         return text + " (Spell-checked)"
 
+# Memoizing Decorator: caches the content of the whole chain below it
+class MemoizedText(MemoizingDecorator, IText):
+    def content(self):
+        return self._memoized("content")
 
 
 # Client
@@ -110,3 +208,22 @@ if __name__ == "__main__":
     text_with_spell_check = SpellCheck(simple_text)
     print("\nText with Spell Check:")
     print(text_with_spell_check.content())
+
+    print("========================================")
+    print("Example 3: Memoizing Decorator")
+
+    base_coffee = Coffee()
+    memoized_coffee = MemoizedCoffee(Sugar(Milk(base_coffee)), max_size=16)
+    print(f"Cost of Coffee with Milk and Sugar: ${memoized_coffee.cost()}")
+    print(f"Cost of Coffee with Milk and Sugar: ${memoized_coffee.cost()}")  # served from cache
+
+    base_coffee.set_price(6)  # bumps the version, the cached cost is now stale
+    print(f"Cost after price change: ${memoized_coffee.cost()}")
+    print(memoized_coffee.cache_info())  # Output: 1 hit, 2 misses
+
+    base_text = Text()
+    memoized_text = MemoizedText(SpellCheck(base_text))
+    print(memoized_text.content())
+    base_text.set_content("This is some edited text.")
+    print(memoized_text.content())
+    print(memoized_text.cache_info())
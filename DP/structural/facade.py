@@ -21,28 +21,202 @@ By the end of this module, you will have a clear understanding of how to use the
 a simplified and user-friendly interface to a complex system, reducing its complexity and making it more accessible to clients.
 """
 
+import asyncio
+import itertools
+import queue
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import Future
+
 # Problemtic Scenario:
 # when you have a complex system with numerous components and interfaces.
 # like a online shopping system, which has a lot of components and interfaces.
 # Interacting with the system can be cumbersome due to its complexity.
 
 class Item:
-    def __init__(self, name: str, price: float):
+    __slots__ = ("item_id", "name", "price")
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, price: float, item_id: int = None):
+        self.item_id = next(Item._ids) if item_id is None else item_id
         self.name = name
         self.price = price
 
+    @property
+    def price_cents(self):
+        return to_cents(self.price)
+
+def to_cents(price):
+    # round() rather than int() so that 19.99 * 100 == 1998.999... becomes 1999
+    return round(price * 100)
+
+# Cart keeps one line per item with its quantity, and a running total
+# that is updated on every add/remove, so calculate_total is O(1)
+# no matter how many lines the cart holds.
 class Cart:
     def __init__(self):
-        self.items = []
+        self.lines = {}  # item -> quantity
+        self._total = 0
+        self._quantity = 0
+
+    @property
+    def items(self):
+        return list(self.lines)
+
+    def add_item(self, item: Item, quantity: int = 1):
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        self.lines[item] = self.lines.get(item, 0) + quantity
+        self._total += item.price * quantity
+        self._quantity += quantity
+
+    def remove_item(self, item: Item, quantity: int = None):
+        if item not in self.lines:
+            raise ValueError(f"{item.name} is not in the cart")
+        current = self.lines[item]
+        if quantity is None or quantity >= current:
+            quantity = current
+            del self.lines[item]
+        elif quantity <= 0:
+            raise ValueError("quantity must be positive")
+        else:
+            self.lines[item] = current - quantity
+        self._total -= item.price * quantity
+        self._quantity -= quantity
+        if not self.lines:
+            self._total = 0  # drop any floating point residue on an empty cart
+
+    def quantity_of(self, item: Item):
+        return self.lines.get(item, 0)
+
+    def total_quantity(self):
+        return self._quantity
+
+    def calculate_total(self):
+        return self._total
+
+# Compact Cart:
+# Line items are stored as three parallel arrays of 64-bit integers
+# (item ids, prices in cents, quantities) instead of a list of objects,
+# so the total is exact integer arithmetic and a snapshot is three buffer copies.
+# Removing a line swaps the last line into its slot, which keeps removal O(1).
+
+class CompactCart:
+    _HEADER = struct.Struct("<Iq")  # number of lines, total in cents
+
+    def __init__(self):
+        self.item_ids = array("q")
+        self.prices = array("q")      # cents
+        self.quantities = array("q")
+        self._index = {}              # item id -> position in the arrays
+        self._total_cents = 0
+
+    def __len__(self):
+        return len(self.item_ids)
+
+    def add_item(self, item: Item, quantity: int = 1):
+        self.add_line(item.item_id, item.price_cents, quantity)
+
+    def add_line(self, item_id: int, price_cents: int, quantity: int = 1):
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        position = self._index.get(item_id)
+        if position is None:
+            self._index[item_id] = len(self.item_ids)
+            self.item_ids.append(item_id)
+            self.prices.append(price_cents)
+            self.quantities.append(quantity)
+        else:
+            if self.prices[position] != price_cents:
+                raise ValueError(f"item {item_id} is already in the cart at a different price")
+            self.quantities[position] += quantity
+        self._total_cents += price_cents * quantity
 
-    def add_item(self, item: Item):
-        self.items.append(item)
+    def remove_item(self, item: Item, quantity: int = None):
+        self.remove_line(item.item_id, quantity)
 
-    def remove_item(self, item: Item):
-        self.items.remove(item)
+    def remove_line(self, item_id: int, quantity: int = None):
+        position = self._index.get(item_id)
+        if position is None:
+            raise ValueError(f"item {item_id} is not in the cart")
+        current = self.quantities[position]
+        if quantity is not None and quantity <= 0:
+            raise ValueError("quantity must be positive")
+        if quantity is None or quantity >= current:
+            self._delete_line(position)
+        else:
+            self.quantities[position] = current - quantity
+            self._total_cents -= self.prices[position] * quantity
+
+    def _delete_line(self, position):
+        item_id = self.item_ids[position]
+        self._total_cents -= self.prices[position] * self.quantities[position]
+        last = len(self.item_ids) - 1
+        if position != last:
+            self.item_ids[position] = self.item_ids[last]
+            self.prices[position] = self.prices[last]
+            self.quantities[position] = self.quantities[last]
+            self._index[self.item_ids[position]] = position
+        self.item_ids.pop()
+        self.prices.pop()
+        self.quantities.pop()
+        del self._index[item_id]
+
+    def quantity_of(self, item: Item):
+        position = self._index.get(item.item_id)
+        return 0 if position is None else self.quantities[position]
+
+    def total_cents(self):
+        return self._total_cents
 
     def calculate_total(self):
-        return sum([item.price for item in self.items])
+        return self._total_cents / 100
+
+    def snapshot(self):
+        return CompactCart._from_arrays(array("q", self.item_ids), array("q", self.prices),
+                                        array("q", self.quantities), self._total_cents)
+
+    def to_bytes(self):
+        # little-endian throughout, like the header, whatever the host byte order
+        columns = (self.item_ids, self.prices, self.quantities)
+        if sys.byteorder != "little":
+            columns = [array("q", column) for column in columns]
+            for column in columns:
+                column.byteswap()
+        return b"".join((self._HEADER.pack(len(self), self._total_cents),
+                         *(column.tobytes() for column in columns)))
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        if len(data) < cls._HEADER.size:
+            raise ValueError(f"CompactCart data is {len(data)} bytes, shorter than its {cls._HEADER.size} byte header")
+        count, total_cents = cls._HEADER.unpack_from(data)
+        column_size = count * array("q").itemsize
+        expected = cls._HEADER.size + 3 * column_size
+        if len(data) != expected:
+            raise ValueError(f"CompactCart data is {len(data)} bytes, expected {expected} for {count} lines")
+        columns = []
+        offset = cls._HEADER.size
+        for _ in range(3):
+            column = array("q")
+            column.frombytes(data[offset:offset + column_size])
+            if sys.byteorder != "little":
+                column.byteswap()
+            offset += column_size
+            columns.append(column)
+        return cls._from_arrays(*columns, total_cents)
+
+    @classmethod
+    def _from_arrays(cls, item_ids, prices, quantities, total_cents):
+        cart = cls()
+        cart.item_ids, cart.prices, cart.quantities = item_ids, prices, quantities
+        cart._index = {item_id: position for position, item_id in enumerate(item_ids)}
+        cart._total_cents = total_cents
+        return cart
 
 class PaymentGateway:
     def charge(self, amount):
@@ -87,10 +261,10 @@ class ShoppingCartFacade:
         self.payment_processor = PaymentProcessor()
         self.shipping_service = ShippingService()
 
-    def add_item_to_cart(self, item, quantity):
+    def add_item_to_cart(self, item, quantity=1):
         self.cart.add_item(item, quantity)
 
-    def remove_item_from_cart(self, item, quantity):
+    def remove_item_from_cart(self, item, quantity=None):
         self.cart.remove_item(item, quantity)
 
     def checkout(self):
@@ -98,6 +272,422 @@ class ShoppingCartFacade:
         self.payment_processor.process_payment(total)
         self.shipping_service.ship_items()
 
+
+# Async Checkout:
+# The blocking checkout above waits for every subsystem in turn.
+# The async path runs the independent checks (fraud scoring, shipping quote,
+# inventory reservation) concurrently, then captures the payment and only
+# after that ships the items. Every step has a timeout, and the steps that
+# already succeeded are compensated (refund, release) when a later one fails.
+# The services below are stand-ins with simulated latency for local benchmarks.
+
+class CheckoutError(Exception):
+    pass
+
+class FraudScoringService:
+    def __init__(self, latency=0.05, threshold=0.9):
+        self.latency = latency
+        self.threshold = threshold
+
+    async def score(self, cart: Cart):
+        await asyncio.sleep(self.latency)
+        return 0.1
+
+    async def check(self, cart: Cart):
+        score = await self.score(cart)
+        if score >= self.threshold:
+            raise CheckoutError(f"Fraud score {score:.2f} is above the threshold")
+        return score
+
+class ShippingQuoteService:
+    def __init__(self, latency=0.05):
+        self.latency = latency
+
+    async def quote(self, cart: Cart):
+        await asyncio.sleep(self.latency)
+        return 4.99 + 0.5 * cart.total_quantity()
+
+class InventoryService:
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.reserved = {}
+        self._next_reservation_id = 0
+
+    async def reserve(self, cart: Cart):
+        await asyncio.sleep(self.latency)
+        # one id per reservation, the same cart may be checked out twice at once
+        self._next_reservation_id += 1
+        reservation_id = self._next_reservation_id
+        self.reserved[reservation_id] = dict(cart.lines)
+        return reservation_id
+
+    async def release(self, reservation_id):
+        await asyncio.sleep(self.latency)
+        self.reserved.pop(reservation_id, None)
+
+class AsyncPaymentProcessor:
+    def __init__(self, latency=0.1):
+        self.latency = latency
+        self.captured = {}
+        self._next_payment_id = 0
+
+    async def capture(self, amount):
+        await asyncio.sleep(self.latency)
+        self._next_payment_id += 1
+        payment_id = self._next_payment_id
+        self.captured[payment_id] = amount
+        return payment_id
+
+    async def refund(self, payment_id):
+        await asyncio.sleep(self.latency)
+        self.captured.pop(payment_id, None)
+
+class AsyncShippingService:
+    def __init__(self, latency=0.1):
+        self.latency = latency
+
+    async def ship_items(self, cart: Cart, reservation_id):
+        await asyncio.sleep(self.latency)
+        return f"shipment-{reservation_id}"
+
+class AsyncShoppingCartFacade(ShoppingCartFacade):
+    def __init__(self, timeout=2.0,
+                 fraud_service=None, quote_service=None, inventory_service=None,
+                 payment_processor=None, shipping_service=None):
+        super().__init__()
+        self.timeout = timeout
+        self.fraud_service = fraud_service or FraudScoringService()
+        self.quote_service = quote_service or ShippingQuoteService()
+        self.inventory_service = inventory_service or InventoryService()
+        self.async_payment_processor = payment_processor or AsyncPaymentProcessor()
+        self.async_shipping_service = shipping_service or AsyncShippingService()
+
+    async def _step(self, awaitable, name):
+        try:
+            return await asyncio.wait_for(awaitable, self.timeout)
+        except asyncio.TimeoutError:
+            raise CheckoutError(f"{name} timed out after {self.timeout}s") from None
+
+    async def checkout_async(self):
+        if not self.cart.lines:
+            raise CheckoutError("Cart is empty")
+
+        # 1. independent steps run concurrently
+        fraud = asyncio.ensure_future(self._step(self.fraud_service.check(self.cart), "Fraud scoring"))
+        quote = asyncio.ensure_future(self._step(self.quote_service.quote(self.cart), "Shipping quote"))
+        reserve = asyncio.ensure_future(self._step(self.inventory_service.reserve(self.cart), "Inventory check"))
+        steps = (fraud, quote, reserve)
+        try:
+            results = await asyncio.gather(*steps, return_exceptions=True)
+        except BaseException:
+            # cancelled from outside (an outer timeout, the client went away): stop the
+            # steps still running and release the reservation if it was already made
+            for step in steps:
+                step.cancel()
+            await asyncio.gather(*steps, return_exceptions=True)
+            if not reserve.cancelled() and reserve.exception() is None:
+                await self.inventory_service.release(reserve.result())
+            raise
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            if not isinstance(results[2], BaseException):
+                await self.inventory_service.release(results[2])
+            raise errors[0]
+        _, shipping_cost, reservation_id = results
+
+        # 2. payment is captured before anything ships
+        total = self.cart.calculate_total() + shipping_cost
+        try:
+            payment_id = await self._step(self.async_payment_processor.capture(total), "Payment capture")
+        except BaseException:
+            await self.inventory_service.release(reservation_id)
+            raise
+
+        # 3. shipment, compensated with a refund and a release on failure
+        try:
+            shipment_id = await self._step(
+                self.async_shipping_service.ship_items(self.cart, reservation_id), "Shipment")
+        except BaseException:
+            await self.async_payment_processor.refund(payment_id)
+            await self.inventory_service.release(reservation_id)
+            raise
+
+        return {"payment_id": payment_id, "shipment_id": shipment_id, "total": total}
+
+    async def checkout_sequential_async(self):
+        # Baseline for the benchmark: the same steps awaited one after another
+        await self.fraud_service.check(self.cart)
+        shipping_cost = await self.quote_service.quote(self.cart)
+        reservation_id = await self.inventory_service.reserve(self.cart)
+        total = self.cart.calculate_total() + shipping_cost
+        payment_id = await self.async_payment_processor.capture(total)
+        shipment_id = await self.async_shipping_service.ship_items(self.cart, reservation_id)
+        return {"payment_id": payment_id, "shipment_id": shipment_id, "total": total}
+
+def benchmark_checkout(n_checkouts=50):
+    async def run(method_name):
+        facades = []
+        for _ in range(n_checkouts):
+            facade = AsyncShoppingCartFacade()
+            facade.add_item_to_cart(Item("Guitar", 1000), 1)
+            facades.append(facade)
+        start = time.perf_counter()
+        for facade in facades:
+            await getattr(facade, method_name)()
+        return (time.perf_counter() - start) / n_checkouts
+
+    sequential = asyncio.run(run("checkout_sequential_async"))
+    concurrent = asyncio.run(run("checkout_async"))
+    print(f"Sequential checkout latency: {sequential * 1000:.1f} ms")
+    print(f"Concurrent checkout latency: {concurrent * 1000:.1f} ms")
+
+
+# Bulk Checkout:
+# At peak load every cart calling the payment gateway and the shipping service
+# on its own is dominated by per-call overhead. The bulk pipeline collects carts
+# into micro-batches (closed by size or by a time window), charges and ships each
+# batch with a single call to batch-capable services, and maps the results back
+# to the Future returned for every submitted cart.
+
+class BatchPaymentGateway(ABC):
+    @abstractmethod
+    def charge_many(self, amounts):
+        # returns one payment id per amount, or None when the charge is declined
+        pass
+
+    @abstractmethod
+    def refund_many(self, payment_ids):
+        # compensates captured payments when a later step of the checkout fails
+        pass
+
+class BatchShippingService(ABC):
+    @abstractmethod
+    def ship_many(self, carts):
+        # returns one shipment id per cart
+        pass
+
+class FakeBatchPaymentGateway(PaymentGateway, BatchPaymentGateway):
+    def __init__(self, call_latency=0.001, decline_above=None):
+        self.call_latency = call_latency
+        self.decline_above = decline_above
+        self.calls = 0
+        self.captured = {}
+        self._next_payment_id = 0
+
+    def charge(self, amount):
+        return self.charge_many([amount])[0]
+
+    def charge_many(self, amounts):
+        time.sleep(self.call_latency)  # one network round trip per call
+        self.calls += 1
+        payment_ids = []
+        for amount in amounts:
+            if self.decline_above is not None and amount > self.decline_above:
+                payment_ids.append(None)
+            else:
+                self._next_payment_id += 1
+                self.captured[self._next_payment_id] = amount
+                payment_ids.append(self._next_payment_id)
+        return payment_ids
+
+    def refund_many(self, payment_ids):
+        time.sleep(self.call_latency)
+        self.calls += 1
+        for payment_id in payment_ids:
+            self.captured.pop(payment_id, None)
+
+class FakeBatchShippingService(ShippingService, BatchShippingService):
+    def __init__(self, call_latency=0.001):
+        self.call_latency = call_latency
+        self.calls = 0
+        self._next_shipment_id = 0
+
+    def ship_items(self):
+        return self.ship_many([None])[0]
+
+    def ship_many(self, carts):
+        time.sleep(self.call_latency)
+        self.calls += 1
+        shipment_ids = []
+        for _ in carts:
+            self._next_shipment_id += 1
+            shipment_ids.append(f"shipment-{self._next_shipment_id}")
+        return shipment_ids
+
+class BulkCheckoutPipeline:
+    _STOP = object()
+
+    def __init__(self, payment_gateway: BatchPaymentGateway, shipping_service: BatchShippingService,
+                 max_batch_size=500, max_wait=0.005):
+        self.payment_gateway = payment_gateway
+        self.shipping_service = shipping_service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+        return self
+
+    def close(self):
+        with self._lock:
+            if self._worker is not None:
+                self._queue.put(self._STOP)
+                self._worker.join()
+                self._worker = None
+            # nothing is left waiting on a pipeline that is gone
+            while True:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is not self._STOP and entry[1].set_running_or_notify_cancel():
+                    entry[1].set_exception(RuntimeError("Pipeline was closed before the cart was checked out"))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, cart: Cart):
+        future = Future()
+        with self._lock:  # never enqueued behind the stop marker
+            if self._worker is None:
+                raise RuntimeError("Pipeline is not running, call start() first")
+            self._queue.put((cart, future))
+        return future
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is self._STOP:
+                break
+            batch = []
+            self._accept(batch, first)
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is self._STOP:
+                    stopping = True
+                    break
+                self._accept(batch, entry)
+            if batch:
+                self._process(batch)
+
+    @staticmethod
+    def _accept(batch, entry):
+        # a Future the caller already cancelled is dropped before anything is charged,
+        # the others can no longer be cancelled once they are part of a batch
+        if entry[1].set_running_or_notify_cancel():
+            batch.append(entry)
+
+    def _process(self, batch):
+        self.batches += 1
+        try:
+            self._settle(batch)
+        except Exception as error:
+            # nothing may escape into the worker thread, and no Future is left unresolved
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+    def _settle(self, batch):
+        totals = [cart.calculate_total() for cart, _ in batch]
+        payment_ids = list(self.payment_gateway.charge_many(totals))
+        if len(payment_ids) != len(batch):
+            # the ids cannot be matched to carts, so nothing that was charged can stand
+            self._refund([payment_id for payment_id in payment_ids if payment_id is not None])
+            raise CheckoutError(f"Payment gateway returned {len(payment_ids)} results for {len(batch)} carts")
+        paid = [(future, total, payment_id)
+                for (_, future), total, payment_id in zip(batch, totals, payment_ids)
+                if payment_id is not None]
+        carts = [cart for (cart, _), payment_id in zip(batch, payment_ids) if payment_id is not None]
+        shipment_ids = []
+        if paid:
+            # a shipment failure refunds the batch's payments, like the async checkout compensates
+            try:
+                shipment_ids = list(self.shipping_service.ship_many(carts))
+                if len(shipment_ids) != len(paid):
+                    raise CheckoutError(f"Shipping service returned {len(shipment_ids)} results for {len(paid)} carts")
+            except Exception:
+                self._refund([payment_id for _, _, payment_id in paid])
+                raise
+
+        for (_, future), total, payment_id in zip(batch, totals, payment_ids):
+            if payment_id is None:
+                future.set_exception(CheckoutError(f"Payment of {total} was declined"))
+        for (future, total, payment_id), shipment_id in zip(paid, shipment_ids):
+            future.set_result({"payment_id": payment_id, "shipment_id": shipment_id, "total": total})
+
+    def _refund(self, payment_ids):
+        if payment_ids:
+            self.payment_gateway.refund_many(payment_ids)
+
+class BulkCheckoutFacade:
+    def __init__(self, payment_gateway=None, shipping_service=None, max_batch_size=500, max_wait=0.005):
+        self.pipeline = BulkCheckoutPipeline(payment_gateway or FakeBatchPaymentGateway(),
+                                             shipping_service or FakeBatchShippingService(),
+                                             max_batch_size, max_wait)
+
+    def checkout(self, cart: Cart):
+        # the pipeline is started on first use and runs until close()
+        return self.pipeline.start().submit(cart)
+
+    def checkout_many(self, carts):
+        futures = [self.checkout(cart) for cart in carts]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except CheckoutError as error:
+                results.append(error)
+        return results
+
+    def close(self):
+        self.pipeline.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def benchmark_bulk_checkout(n_carts=2000):
+    carts = []
+    for i in range(n_carts):
+        cart = Cart()
+        cart.add_item(Item(f"Item {i}", 10 + i % 50), 1 + i % 3)
+        carts.append(cart)
+
+    gateway, shipping = FakeBatchPaymentGateway(), FakeBatchShippingService()
+    sample = carts[:200]  # the per-cart loop is slow, so time a sample and scale it
+    start = time.perf_counter()
+    for cart in sample:
+        gateway.charge(cart.calculate_total())
+        shipping.ship_items()
+    per_cart_rate = len(sample) / (time.perf_counter() - start)
+
+    with BulkCheckoutFacade() as facade:
+        start = time.perf_counter()
+        facade.checkout_many(carts)
+        bulk_rate = n_carts / (time.perf_counter() - start)
+    print(f"Per-cart checkout: {per_cart_rate:,.0f} carts/s")
+    print(f"Bulk checkout:     {bulk_rate:,.0f} carts/s ({facade.pipeline.batches} batches)")
+
 #Client Code
 if __name__ == "__main__":
     # without facade pattern
@@ -115,6 +705,52 @@ if __name__ == "__main__":
     # with Facade pattern
     facade = ShoppingCartFacade()
     facade.add_item_to_cart(Item("Guitar", 1000), 1)
-    facade.add_item_to_cart(Item("Pick box", 5), 1)
+    facade.add_item_to_cart(Item("Pick box", 5), 3)
     facade.checkout()
 
+    # with async Facade
+    async_facade = AsyncShoppingCartFacade()
+    async_facade.add_item_to_cart(Item("Guitar", 1000), 1)
+    print(asyncio.run(async_facade.checkout_async()))
+
+    # a shipment failure refunds the payment and releases the inventory
+    failing_facade = AsyncShoppingCartFacade(timeout=0.5, shipping_service=AsyncShippingService(latency=1))
+    failing_facade.add_item_to_cart(Item("Guitar", 1000), 1)
+    try:
+        asyncio.run(failing_facade.checkout_async())
+    except CheckoutError as error:
+        print(f"Checkout failed: {error}")
+        print(f"Captured payments after compensation: {failing_facade.async_payment_processor.captured}")
+
+    benchmark_checkout(n_checkouts=10)
+
+    # bulk checkout
+    bulk_carts = []
+    for price in (10, 20, 5000):
+        bulk_cart = Cart()
+        bulk_cart.add_item(Item("Gift card", price), 1)
+        bulk_carts.append(bulk_cart)
+    with BulkCheckoutFacade(FakeBatchPaymentGateway(decline_above=1000)) as bulk_facade:
+        for result in bulk_facade.checkout_many(bulk_carts):
+            print(result)
+        print(bulk_facade.checkout(bulk_carts[0]).result())
+
+    # a failed batch shipment refunds every payment of the batch
+    class FailingBatchShippingService(FakeBatchShippingService):
+        def ship_many(self, carts):
+            raise CheckoutError("Shipping service unavailable")
+
+    failing_gateway = FakeBatchPaymentGateway()
+    with BulkCheckoutFacade(failing_gateway, FailingBatchShippingService()) as failing_bulk_facade:
+        print(failing_bulk_facade.checkout_many(bulk_carts))
+    print(f"Captured payments after compensation: {failing_gateway.captured}")
+
+    benchmark_bulk_checkout()
+
+    # compact cart with exact integer-cent totals
+    compact_cart = CompactCart()
+    compact_cart.add_item(Item("Strings", 19.99), 3)
+    compact_cart.add_item(Item("Capo", 0.1), 3)
+    print(f"Compact cart total: {compact_cart.total_cents()} cents")  # Output: 6027 cents
+    restored_cart = CompactCart.from_bytes(compact_cart.snapshot().to_bytes())
+    print(f"Restored snapshot total: {restored_cart.calculate_total():.2f}")